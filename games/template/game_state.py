@@ -40,7 +40,8 @@ class GameState(Board):
         multiplier_value = get_random_outcome(
             self.get_current_distribution_conditions()["multiplier_values"][
                 self.game_type
-            ]
+            ],
+            rng=self.rng,
         )
         symbol.multiplier = multiplier_value
 
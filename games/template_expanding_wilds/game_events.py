@@ -16,7 +16,7 @@ def new_expanding_wild_event(game_state) -> None:
     event = {
         "index": len(game_state.book.events),
         "type": EventConstants.REVEAL_EXPANDING_WILDS.value,
-        "newWilds": new_exp_wilds,
+        "newWilds": deepcopy(new_exp_wilds),
     }
     game_state.book.add_event(event)
 
@@ -49,7 +49,7 @@ def new_sticky_event(game_state, new_sticky_syms: list):
     event = {
         "index": len(game_state.book.events),
         "type": EventConstants.ADD_STICKY_SYMBOLS.value,
-        "newPrizes": new_sticky_syms,
+        "newPrizes": deepcopy(new_sticky_syms),
     }
     game_state.book.add_event(event)
 
@@ -118,11 +118,11 @@ def reveal_prize_event(game_state):
         "type": EventConstants.REVEAL.value,
         "board": board_client,
         "gameType": "superSpin",
-        "anticipation": game_state.anticipation,
+        "anticipation": list(game_state.anticipation),
     }
 
     # Only include paddingPositions if enabled in config
     if game_state.config.output_padding_positions:
-        event["paddingPositions"] = game_state.reel_positions
+        event["paddingPositions"] = list(game_state.reel_positions)
 
     game_state.book.add_event(event)
@@ -4,7 +4,6 @@ Inheritance: Board → GameState
 All game-specific logic consolidated in this single file.
 """
 
-import random
 from copy import deepcopy
 from typing import Any
 
@@ -62,7 +61,8 @@ class GameState(Board):
             multiplier_value = get_random_outcome(
                 self.get_current_distribution_conditions()["multiplier_values"][
                     self.game_type
-                ]
+                ],
+                rng=self.rng,
             )
             symbol.assign_attribute({"multiplier": multiplier_value})
 
@@ -73,7 +73,7 @@ class GameState(Board):
             symbol: Symbol object to assign prize to
         """
         multiplier_value = get_random_outcome(
-            self.get_current_distribution_conditions()["prize_values"]
+            self.get_current_distribution_conditions()["prize_values"], rng=self.rng
         )
         symbol.assign_attribute({"prize": multiplier_value})
 
@@ -133,7 +133,8 @@ class GameState(Board):
             new_mult_on_reveal = get_random_outcome(
                 self.get_current_distribution_conditions()["multiplier_values"][
                     self.game_type
-                ]
+                ],
+                rng=self.rng,
             )
             expwild["multiplier"] = new_mult_on_reveal
             updated_exp_wild.append(
@@ -154,8 +155,8 @@ class GameState(Board):
         self.new_exp_wilds = []
         for _ in range(max_num_new_wilds):
             if len(self.avaliable_reels) > 0:
-                chosen_reel = random.choice(self.avaliable_reels)
-                chosen_row = random.choice(
+                chosen_reel = self.rng.choice(self.avaliable_reels)
+                chosen_row = self.rng.choice(
                     [i for i in range(self.config.num_rows[chosen_reel])]
                 )
                 self.avaliable_reels.remove(chosen_reel)
@@ -163,7 +164,8 @@ class GameState(Board):
                 wild_reel_multiplier = get_random_outcome(
                     self.get_current_distribution_conditions()["multiplier_values"][
                         self.game_type
-                    ]
+                    ],
+                    rng=self.rng,
                 )
                 expwild_details = {
                     "reel": chosen_reel,
@@ -304,7 +306,8 @@ class GameState(Board):
 
             # Assign new expanding wilds
             wild_on_reveal = get_random_outcome(
-                self.get_current_distribution_conditions()["landing_wilds"]
+                self.get_current_distribution_conditions()["landing_wilds"],
+                rng=self.rng,
             )
             self.assign_new_wilds(wild_on_reveal)
             self.update_with_existing_wilds()
@@ -375,8 +378,9 @@ class GameState(Board):
         prize_win = self.get_final_board_prize()
         self.win_data = prize_win
         if prize_win["totalWin"] > 0:
-            self.win_manager.update_spin_win(prize_win["totalWin"])
-            self.win_manager.update_game_type_wins(self.game_type)
+            self.win_manager.update_spin_and_game_type_wins(
+                prize_win["totalWin"], self.game_type
+            )
 
         if self.win_manager.spin_win > 0:
             win_info_prize_event(self)
@@ -43,7 +43,8 @@ class GameState(Board):
             multiplier_value = get_random_outcome(
                 self.get_current_distribution_conditions()["multiplier_values"][
                     self.game_type
-                ]
+                ],
+                rng=self.rng,
             )
         symbol.assign_attribute({"multiplier": multiplier_value})
 
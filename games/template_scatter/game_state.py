@@ -4,7 +4,6 @@ Inheritance: Tumble → Board → GameState
 All game-specific logic consolidated in this single file.
 """
 
-from copy import copy
 from typing import Any
 
 # Import game-specific events
@@ -50,7 +49,8 @@ class GameState(Tumble):
         multiplier_value = get_random_outcome(
             self.get_current_distribution_conditions()["multiplier_values"][
                 self.game_type
-            ]
+            ],
+            rng=self.rng,
         )
         symbol.assign_attribute({"multiplier": multiplier_value})
 
@@ -144,7 +144,7 @@ class GameState(Tumble):
         """
         if self.game_type == self.config.free_game_type:
             board_multiplier, multiplier_info = self.get_board_multipliers()
-            base_tumble_win = copy(self.win_manager.spin_win)
+            base_tumble_win = self.win_manager.spin_win
             self.win_manager.set_spin_win(base_tumble_win * board_multiplier)
 
             if self.win_manager.spin_win > 0 and len(multiplier_info) > 0:
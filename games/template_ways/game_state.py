@@ -38,7 +38,8 @@ class GameState(Board):
             symbol: Symbol object to assign multiplier to
         """
         multiplier_value = get_random_outcome(
-            self.get_current_distribution_conditions()["multiplier_values"]
+            self.get_current_distribution_conditions()["multiplier_values"],
+            rng=self.rng,
         )
         symbol.assign_attribute({"multiplier": multiplier_value})
 
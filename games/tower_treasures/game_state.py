@@ -4,7 +4,6 @@ Inheritance: Board → GameState
 All game-specific logic consolidated in this single file.
 """
 
-import random
 from typing import Any
 
 # Import game-specific events
@@ -50,7 +49,8 @@ class GameState(Board):
         multiplier_value = get_random_outcome(
             self.get_current_distribution_conditions()["multiplier_values"][
                 self.game_type
-            ]
+            ],
+            rng=self.rng,
         )
         symbol.assign_attribute({"multiplier": multiplier_value})
 
@@ -183,7 +183,7 @@ class GameState(Board):
             # Only upgrade L symbols with clusters of 5 or more
             if symbol.startswith("L") and cluster_count >= 5:
                 # Pick a random position from the winning cluster
-                random_position = random.choice(positions)
+                random_position = self.rng.choice(positions)
 
                 # Determine what symbol it was upgraded to
                 if hasattr(self.config, "upgrade_config"):
@@ -1,5 +1,6 @@
 """Stake Engine Math SDK package setup."""
 
+import os
 from pathlib import Path
 
 from setuptools import find_packages, setup
@@ -10,6 +11,15 @@ long_description = (
     readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
 )
 
+# Optional native build of simulation hot paths with mypyc (ships with mypy).
+# Opt in with STAKE_ENGINE_MYPYC=1; the pure-Python modules are used otherwise.
+MYPYC_MODULES = ["src/formatter.py", "src/state/force_records.py"]
+ext_modules = []
+if os.environ.get("STAKE_ENGINE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(MYPYC_MODULES)
+
 setup(
     name="stake-engine-math",
     version="2.0.0",
@@ -66,4 +76,5 @@ setup(
     keywords="slot-games simulation optimization rng game-math casino gambling",
     include_package_data=True,
     zip_safe=False,
+    ext_modules=ext_modules,
 )
@@ -7,7 +7,6 @@ anticipation logic for scatter symbols.
 
 from __future__ import annotations
 
-import random
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
@@ -41,74 +40,62 @@ class Board(GameState):
         Generates a random board by selecting random stop positions on each reel,
         creating symbols, and tracking special symbols and anticipation logic.
         """
-        if self.config.include_padding:
+        # Config reads hoisted to locals; this runs once per spin
+        num_reels: int = self.config.num_reels
+        num_rows: list[int] = self.config.num_rows
+        include_padding: bool = self.config.include_padding
+        if include_padding:
             top_symbols: list[Symbol] = []
             bottom_symbols: list[Symbol] = []
         self.refresh_special_symbols()
         self.reel_strip_id: str = get_random_outcome(
-            self.get_current_distribution_conditions()["reel_weights"][self.game_type]
+            self.get_current_distribution_conditions()["reel_weights"][self.game_type],
+            rng=self.rng,
         )
-        self.reel_strip = self.config.reels[self.reel_strip_id]
-        anticipation: list[int] = [0] * self.config.num_reels
-        board: Any = [[]] * self.config.num_reels
-        for i in range(self.config.num_reels):
-            board[i] = [0] * self.config.num_rows[i]
+        reel_strip = self.reel_strip = self.config.reels[self.reel_strip_id]
+        anticipation: list[int] = [0] * num_reels
+        board: Any = [[0] * num_rows[i] for i in range(num_reels)]
         reel_positions: list[int] = [
-            random.randrange(0, len(self.reel_strip[reel]))
-            for reel in range(self.config.num_reels)
+            self.next_rand(len(reel_strip[reel])) for reel in range(num_reels)
         ]
-        padding_positions: list[int] = [0] * self.config.num_reels
+        padding_positions: list[int] = [0] * num_reels
         first_scatter_reel: int = -1
-        for reel in range(self.config.num_reels):
+        create_symbol = self.create_symbol
+        special_kinds_by_symbol = self._special_kinds_by_symbol
+        for reel in range(num_reels):
             reel_pos: int = reel_positions[reel]
-            if self.config.include_padding:
-                top_symbols.append(
-                    self.create_symbol(
-                        self.reel_strip[reel][
-                            (reel_pos - 1) % len(self.reel_strip[reel])
-                        ]
-                    )
-                )
+            strip = reel_strip[reel]
+            strip_len = len(strip)
+            board_reel = board[reel]
+            if include_padding:
+                top_symbols.append(create_symbol(strip[(reel_pos - 1) % strip_len]))
                 bottom_symbols.append(
-                    self.create_symbol(
-                        self.reel_strip[reel][
-                            (reel_pos + len(board[reel])) % len(self.reel_strip[reel])
-                        ]
-                    )
+                    create_symbol(strip[(reel_pos + len(board_reel)) % strip_len])
                 )
-            for row in range(self.config.num_rows[reel]):
-                sym_id: str = self.reel_strip[reel][
-                    (reel_pos + row) % len(self.reel_strip[reel])
-                ]
-                sym: Symbol = self.create_symbol(sym_id)  # type: ignore[assignment]
-                board[reel][row] = sym
+            for row in range(num_rows[reel]):
+                sym_id: str = strip[(reel_pos + row) % strip_len]
+                sym: Symbol = create_symbol(sym_id)  # type: ignore[assignment]
+                board_reel[row] = sym
                 if sym.special:
-                    for special_symbol in self.special_symbols_on_board:
-                        for name in self.config.special_symbols[special_symbol]:
-                            if board[reel][row].name == name:
-                                self.special_symbols_on_board[special_symbol] += [
-                                    {"reel": reel, "row": row}
-                                ]
-                                if (
-                                    board[reel][row].check_attribute("scatter")
-                                    and len(
-                                        self.special_symbols_on_board[special_symbol]
-                                    )
-                                    >= self.config.anticipation_triggers[self.game_type]
-                                    and first_scatter_reel == -1
-                                ):
-                                    first_scatter_reel = reel + 1
-            padding_positions[reel] = (
-                reel_positions[reel] + len(board[reel]) + 1
-            ) % len(self.reel_strip[reel])
-
-        if first_scatter_reel > -1 and first_scatter_reel != self.config.num_reels:
-            count: int = 1
-            for reel in range(first_scatter_reel, self.config.num_reels):
-                anticipation[reel] = count
-                count += 1
-
-        for r in range(1, self.config.num_reels):
+                    for special_symbol in special_kinds_by_symbol.get(sym.name, ()):
+                        positions = self.special_symbols_on_board[special_symbol]
+                        positions.append({"reel": reel, "row": row})
+                        if (
+                            sym.check_attribute("scatter")
+                            and len(positions)
+                            >= self.config.anticipation_triggers[self.game_type]
+                            and first_scatter_reel == -1
+                        ):
+                            first_scatter_reel = reel + 1
+            padding_positions[reel] = (reel_pos + len(board_reel) + 1) % strip_len
+
+        if first_scatter_reel > -1 and first_scatter_reel != num_reels:
+            # Count up 1, 2, ... on every reel after the trigger reel
+            anticipation[first_scatter_reel:] = range(
+                1, num_reels - first_scatter_reel + 1
+            )
+
+        for r in range(1, num_reels):
             if anticipation[r - 1] > anticipation[r]:
                 raise BoardGenerationError(
                     f"Invalid anticipation sequence at reel {r}: "
@@ -126,7 +113,7 @@ class Board(GameState):
         self.reel_positions = reel_positions
         self.padding_positions = padding_positions
         self.anticipation = anticipation
-        if self.config.include_padding:
+        if include_padding:
             self.top_symbols = top_symbols
             self.bottom_symbols = bottom_symbols
 
@@ -152,10 +139,10 @@ class Board(GameState):
 
         reel_positions: list[int | None] = [None] * self.config.num_reels
         for r, stop in force_stop_positions.items():
-            reel_positions[r] = stop - random.randint(0, self.config.num_rows[r] - 1)
+            reel_positions[r] = stop - self.rng.randint(0, self.config.num_rows[r] - 1)
         for r, _ in enumerate(reel_positions):
             if reel_positions[r] is None:
-                reel_positions[r] = random.randrange(0, len(self.reel_strip[r]))
+                reel_positions[r] = self.rng.randrange(0, len(self.reel_strip[r]))
 
         padding_positions: list[int] = [0] * self.config.num_reels
         first_scatter_reel: int = -1
@@ -184,28 +171,25 @@ class Board(GameState):
                 board[reel][row] = sym
 
                 if sym.special:
-                    for special_symbol in self.special_symbols_on_board:
-                        for name in self.config.special_symbols[special_symbol]:
-                            if board[reel][row].name == name:
-                                self.special_symbols_on_board[special_symbol] += [
-                                    {"reel": reel, "row": row}
-                                ]
-                                if (
-                                    board[reel][row].check_attribute("scatter")
-                                    and len(
-                                        self.special_symbols_on_board[special_symbol]
-                                    )
-                                    >= self.config.anticipation_triggers[self.game_type]
-                                    and first_scatter_reel == -1
-                                ):
-                                    first_scatter_reel = reel + 1
+                    for special_symbol in self._special_kinds_by_symbol.get(
+                        sym.name, ()
+                    ):
+                        positions = self.special_symbols_on_board[special_symbol]
+                        positions.append({"reel": reel, "row": row})
+                        if (
+                            sym.check_attribute("scatter")
+                            and len(positions)
+                            >= self.config.anticipation_triggers[self.game_type]
+                            and first_scatter_reel == -1
+                        ):
+                            first_scatter_reel = reel + 1
                 padding_positions[reel] = (reel_positions[reel] + len(board[reel]) + 1) % len(self.reel_strip[reel])  # type: ignore[index]
 
         if first_scatter_reel > -1 and first_scatter_reel <= self.config.num_reels:
-            count: int = 1
-            for reel in range(first_scatter_reel, self.config.num_reels):
-                anticipation[reel] = count
-                count += 1
+            # Count up 1, 2, ... on every reel after the trigger reel
+            anticipation[first_scatter_reel:] = range(
+                1, self.config.num_reels - first_scatter_reel + 1
+            )
 
         self.board = board
         self.reveal_scatter_positions = deepcopy(
@@ -321,21 +305,18 @@ class Board(GameState):
             emit_event: Whether to emit REVEAL event after drawing (default: True)
             trigger_symbol: Special symbol type to check for triggers (default: "scatter")
         """
-        if (
-            self.get_current_distribution_conditions()["force_free_game"]
-            and self.game_type == self.config.base_game_type
-        ):
+        force_free_game = self.get_current_distribution_flags().force_free_game
+        if force_free_game and self.game_type == self.config.base_game_type:
             num_scatters: int = get_random_outcome(
-                self.get_current_distribution_conditions()["scatter_triggers"]
+                self.get_current_distribution_conditions()["scatter_triggers"],
+                rng=self.rng,
             )
             self.force_special_board(trigger_symbol, num_scatters)
-        elif (
-            not (self.get_current_distribution_conditions()["force_free_game"])
-            and self.game_type == self.config.base_game_type
-        ):
+        elif not force_free_game and self.game_type == self.config.base_game_type:
             self.create_board_reel_strips()
-            while self.count_special_symbols(trigger_symbol) >= min(
-                self.config.free_spin_triggers[self.game_type].keys()
+            while (
+                self.count_special_symbols(trigger_symbol)
+                >= self._min_trigger_by_game_type[self.game_type]
             ):
                 self.create_board_reel_strips()
         else:
@@ -380,7 +361,8 @@ class Board(GameState):
             num_forced_symbols: Number of symbols to force
         """
         reel_strip_id: str = get_random_outcome(
-            self.get_current_distribution_conditions()["reel_weights"][self.game_type]
+            self.get_current_distribution_conditions()["reel_weights"][self.game_type],
+            rng=self.rng,
         )
         reel_stops: list[list[int]] = self.get_syms_on_reel(
             reel_strip_id, force_criteria
@@ -397,8 +379,8 @@ class Board(GameState):
                 i for i in range(self.config.num_reels) if symbol_probs[i] > 0
             ]
             possible_probs: list[float] = [p for p in symbol_probs if p > 0]
-            chosen_reel: int = random.choices(possible_reels, possible_probs)[0]
-            chosen_stop: int = random.choice(reel_stops[chosen_reel])
+            chosen_reel: int = self.rng.choices(possible_reels, possible_probs)[0]
+            chosen_stop: int = self.rng.choice(reel_stops[chosen_reel])
             symbol_probs[chosen_reel] = 0
             force_stop_positions[int(chosen_reel)] = int(chosen_stop)
 
@@ -15,7 +15,9 @@ from src.exceptions import WinCalculationError
 
 
 def get_random_outcome(
-    distribution: dict[Any, float], total_weight: float | None = None
+    distribution: dict[Any, float],
+    total_weight: float | None = None,
+    rng: random.Random | None = None,
 ) -> Any:
     """Returns a random value from a weighted distribution.
 
@@ -26,6 +28,8 @@ def get_random_outcome(
     Args:
         distribution: Dict mapping values to their weights {value: weight, ...}
         total_weight: Optional pre-calculated sum of all weights (for performance)
+        rng: Optional RNG to draw from, usually the game state's self.rng.
+            Defaults to the global random module
 
     Returns:
         A value from the distribution keys, selected based on weights
@@ -36,7 +40,7 @@ def get_random_outcome(
 
     Example:
         >>> dist = {"A": 10, "B": 20, "C": 70}
-        >>> outcome = get_random_outcome(dist)  # 70% chance of "C"
+        >>> outcome = get_random_outcome(dist, rng=self.rng)  # 70% chance of "C"
     """
     if not isinstance(distribution, dict):
         raise WinCalculationError(
@@ -55,7 +59,7 @@ def get_random_outcome(
             f"Distribution has non-positive total weight ({total_weight}). "
             f"All weights must be positive. Distribution keys: {list(distribution.keys())}."
         )
-    roll: float = random.uniform(0, total_weight)
+    roll: float = (rng or random).uniform(0, total_weight)
     cumulative: float = 0.0
     for value, weight in distribution.items():
         cumulative += weight
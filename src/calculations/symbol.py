@@ -159,6 +159,7 @@ class Symbol:
         paying_symbols, symbol_paytables = Symbol._paytable_cache[config_id]
 
         # Assign symbol properties
+        self.paytable: dict[str, float] | None
         if self.name in paying_symbols:
             self.is_paying = True
             self.paytable = symbol_paytables[self.name]
@@ -30,6 +30,7 @@ class BetMode:
         _is_feature: Whether this is a feature mode
         _is_buy_bonus: Whether this is a buy-bonus mode
         _distributions: List of distribution configurations
+        _dist_by_criteria: Lazily built criteria -> distribution index
         _rtp: Target RTP for this mode
         _force_keys: Keys tracked for force/optimization
 
@@ -76,6 +77,7 @@ class BetMode:
         self._is_feature: bool = is_feature
         self._is_buy_bonus: bool = is_buy_bonus
         self._distributions: list[Any] = distributions
+        self._dist_by_criteria: dict[str, Any] | None = None
         self.set_rtp(rtp)
         self.set_force_keys()
 
@@ -109,6 +111,8 @@ class BetMode:
     def set_force_keys(self) -> None:
         """Initialize empty force keys list for optimization tracking."""
         self._force_keys: list[str] = []
+        # Mirrors _force_keys for O(1) membership checks
+        self._force_key_set: set[str] = set()
 
     def add_force_key(self, force_key: str) -> None:
         """Add a new force key for optimization tracking.
@@ -117,6 +121,18 @@ class BetMode:
             force_key: Key identifier to track
         """
         self._force_keys.append(str(force_key))
+        self._force_key_set.add(str(force_key))
+
+    def has_force_key(self, force_key: str) -> bool:
+        """Check whether a force key is already tracked.
+
+        Args:
+            force_key: Key identifier to look up
+
+        Returns:
+            True if the key has been added
+        """
+        return force_key in self._force_key_set
 
     def lock_force_keys(self) -> None:
         """Finalize force keys at end of bet_mode simulation.
@@ -201,6 +217,24 @@ class BetMode:
         """
         return self._distributions
 
+    def get_distribution(self, target_criteria: str) -> Any | None:
+        """Return the distribution for a criteria, or None if it is not defined.
+
+        The criteria index is built on first use; if criteria repeat, the
+        first distribution wins, matching a front-to-back scan.
+
+        Args:
+            target_criteria: Criteria identifier to look up
+
+        Returns:
+            Distribution object for the criteria, or None
+        """
+        if self._dist_by_criteria is None:
+            self._dist_by_criteria = {}
+            for dist in self._distributions:
+                self._dist_by_criteria.setdefault(dist._criteria, dist)
+        return self._dist_by_criteria.get(target_criteria)
+
     def get_distribution_conditions(self, target_criteria: str) -> dict[str, Any]:
         """Return conditions for a specific distribution criteria.
 
@@ -213,10 +247,9 @@ class BetMode:
         Raises:
             RuntimeError: If target criteria not found in distributions
         """
-        for dist in self.get_distributions():
-            if dist._criteria == target_criteria:
-                # type: ignore[no-any-return]
-                return dist._conditions
+        dist = self.get_distribution(target_criteria)
+        if dist is not None:
+            return dist._conditions  # type: ignore[no-any-return]
         available_criteria = [dist._criteria for dist in self.get_distributions()]
         raise GameConfigError(
             f"Distribution criteria '{target_criteria}' not found in bet_mode '{self._name}'. "
@@ -51,6 +51,10 @@ class Config:
         skip_derived_wins: Skip SET_WIN, SET_TOTAL_WIN (client can sum WIN events)
         skip_progress_updates: Skip UPDATE_FREE_SPINS, UPDATE_TUMBLE_WIN counters
         verbose_event_level: Event verbosity ("full"=all, "standard"=important, "minimal"=required only)
+        batch_rng: Draw reel stops from a batched NumPy stream seeded per
+            (bet mode, thread, repeat); individual books are not reproducible
+        copy_book_events: Copy every event as it is added to the book
+        seed_global_random: Also reseed the random module for older game code
     """
 
     def __init__(self) -> None:
@@ -89,6 +93,21 @@ class Config:
             False  # Include current board state in tumble events (for debugging)
         )
 
+        # Batched NumPy RNG for reel stops. Faster, but the stream is seeded
+        # once per (bet mode, thread, repeat) and never reseeded per sim, so
+        # a single book ID cannot be reproduced on its own: its draws, and
+        # those of any repeat attempts in run_spin, depend on every earlier
+        # sim in the batch. Only a whole batch is reproducible.
+        self.batch_rng: bool = False
+
+        # Books copy each added event so producers may reuse live containers.
+        # Disable only once every event producer builds fresh containers.
+        self.copy_book_events: bool = True
+
+        # Compatibility for game code that draws from the random module rather
+        # than self.rng: reseed it alongside self.rng before every spin.
+        self.seed_global_random: bool = False
+
         if self.game_id != "template_sample":
             self.construct_paths()
 
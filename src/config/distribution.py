@@ -1,9 +1,18 @@
 """Set and verify simulation parameters."""
 
 import json
+from dataclasses import dataclass
 from typing import Union
 
 
+@dataclass(frozen=True, slots=True)
+class DistributionFlags:
+    """Boolean conditions checked on every simulation, as typed attributes."""
+
+    force_wincap: bool
+    force_free_game: bool
+
+
 class Distribution:
     """Setup simulation conditions."""
 
@@ -46,6 +55,14 @@ class Distribution:
                 ]
 
         self._conditions = conditions
+        self._flags = DistributionFlags(
+            force_wincap=bool(conditions.get("force_wincap")),
+            force_free_game=bool(conditions.get("force_free_game")),
+        )
+
+    def get_flags(self):
+        """Return force_wincap/force_free_game as a DistributionFlags."""
+        return self._flags
 
     def get_criteria(self):
         """Return distribution criteria value."""
@@ -46,7 +46,8 @@ class ExecutionConfig:
     """Execution settings for simulation and optimization.
 
     Attributes:
-        num_threads: Number of threads for parallel simulation
+        num_threads: Number of worker processes for parallel simulation
+            (0 = one per CPU core)
         rust_threads: Number of threads for Rust optimization
         batching_size: Number of simulations per batch
         compression: Enable zstd compression for output files
@@ -61,8 +62,13 @@ class ExecutionConfig:
 
     def __post_init__(self) -> None:
         """Validate execution settings."""
+        if self.num_threads == 0:
+            self.num_threads = os.cpu_count() or 1
         if self.num_threads < 1:
-            raise ValueError(f"num_threads must be >= 1, got {self.num_threads}")
+            raise ValueError(
+                f"num_threads must be >= 1 (or 0 for one per CPU core), "
+                f"got {self.num_threads}"
+            )
         if self.rust_threads < 1:
             raise ValueError(f"rust_threads must be >= 1, got {self.rust_threads}")
         if self.batching_size < 1:
@@ -39,13 +39,9 @@ def reveal_event(game_state: Any) -> None:
     special_attributes = list(game_state.config.special_symbols.keys())
 
     # Use formatter to format the board
-    board_client: list[list[Any]] = []
-    for reel, _ in enumerate(game_state.board):
-        board_client.append([])
-        for row in range(len(game_state.board[reel])):
-            board_client[reel].append(
-                formatter.format_symbol(game_state.board[reel][row], special_attributes)
-            )
+    board_client: list[list[Any]] = formatter.format_board(
+        game_state.board, special_attributes
+    )
 
     if game_state.config.include_padding:
         for reel, _ in enumerate(board_client):
@@ -65,12 +61,12 @@ def reveal_event(game_state: Any) -> None:
         "type": EventConstants.REVEAL.value,
         "board": board_client,
         "gameType": to_camel_case(game_state.game_type),
-        "anticipation": game_state.anticipation,
+        "anticipation": list(game_state.anticipation),
     }
 
     # Only include paddingPositions if enabled in config
     if game_state.config.output_padding_positions:
-        event["paddingPositions"] = game_state.reel_positions
+        event["paddingPositions"] = list(game_state.reel_positions)
 
     game_state.book.add_event(event)
 
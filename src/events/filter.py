@@ -31,6 +31,8 @@ class EventFilter:
         skip_derived_wins: Whether to skip SET_WIN, SET_TOTAL_WIN events
         skip_progress_updates: Whether to skip UPDATE_FREE_SPINS, UPDATE_TUMBLE_WIN
         verbose_event_level: Event verbosity level ("full", "standard", "minimal")
+        includes_all: True when no setting can drop an event, so callers may
+            skip the filter entirely
     """
 
     # Event categories for verbosity filtering
@@ -74,6 +76,14 @@ class EventFilter:
         self.skip_derived_wins = config.skip_derived_wins
         self.skip_progress_updates = config.skip_progress_updates
         self.verbose_event_level = config.verbose_event_level
+        self.includes_all: bool = not (
+            self.skip_derived_wins
+            or self.skip_progress_updates
+            or self.verbose_event_level in ("minimal", "standard")
+            or config.skip_implicit_events
+        )
+        # Type-only filter outcome per event type, filled on first sight
+        self._type_decisions: dict[str, bool] = {}
 
     def should_include_event(
         self, event_type: str, event_data: dict[str, Any] | None = None
@@ -98,6 +108,31 @@ class EventFilter:
         if event_type in self.REQUIRED_EVENTS:
             return True
 
+        # Type-based checks depend only on config, so decide once per type
+        passes_type = self._type_decisions.get(event_type)
+        if passes_type is None:
+            passes_type = self._passes_type_filters(event_type)
+            self._type_decisions[event_type] = passes_type
+        if not passes_type:
+            return False
+
+        # Context-based filtering (if event_data provided)
+        if event_data is not None:
+            if not self._passes_context_filter(event_type, event_data):
+                return False
+
+        return True
+
+    def _passes_type_filters(self, event_type: str) -> bool:
+        """Apply the filters that depend only on the event type.
+
+        Args:
+            event_type: Event type constant
+
+        Returns:
+            False if derived-win, progress-update or verbosity settings drop
+            this event type
+        """
         # Check derived wins filtering
         if self.skip_derived_wins and self._is_derived_win_event(event_type):
             return False
@@ -107,15 +142,7 @@ class EventFilter:
             return False
 
         # Check verbosity level
-        if not self._passes_verbosity_filter(event_type):
-            return False
-
-        # Context-based filtering (if event_data provided)
-        if event_data is not None:
-            if not self._passes_context_filter(event_type, event_data):
-                return False
-
-        return True
+        return self._passes_verbosity_filter(event_type)
 
     def _is_derived_win_event(self, event_type: str) -> bool:
         """Check if event is a derived win event (can be calculated from WIN events).
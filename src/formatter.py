@@ -8,11 +8,16 @@ and verbose (human-readable) output modes.
 from __future__ import annotations
 
 from enum import Enum
+from itertools import repeat
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from src.calculations.symbol import Symbol
 
+# C-level accessor for the compact, attribute-free symbol format
+_get_symbol_name = attrgetter("name")
+
 
 class OutputMode(Enum):
     """Output format modes for simulation results.
@@ -52,6 +57,14 @@ class OutputFormatter:
         >>> # Returns: {"name": "L5"} (object)
     """
 
+    __slots__ = (
+        "output_mode",
+        "include_losing_boards",
+        "compress_positions",
+        "simple_symbols",
+        "skip_implicit_events",
+    )
+
     def __init__(
         self,
         output_mode: OutputMode = OutputMode.VERBOSE,
@@ -177,7 +190,7 @@ class OutputFormatter:
     def format_position_list(
         self,
         positions: list[dict[str, int]],
-    ) -> list[list[int]] | list[dict[str, int]]:
+    ) -> list[list[int] | dict[str, int]]:
         """Format a list of positions for output.
 
         Args:
@@ -266,12 +279,12 @@ class OutputFormatter:
             >>> formatted = formatter.format_board(board, [])
             >>> # Returns: [["L5", "H1", ...], ["L3", "H2", ...], ...]
         """
-        formatted_board: list[list[str | dict[str, Any]]] = []
-
-        for reel in board:
-            formatted_reel: list[str | dict[str, Any]] = []
-            for symbol in reel:
-                formatted_reel.append(self.format_symbol(symbol, special_attributes))
-            formatted_board.append(formatted_reel)
-
-        return formatted_board
+        if self.simple_symbols and not special_attributes:
+            # Nothing can force the verbose fallback: emit names directly
+            return [list(map(_get_symbol_name, reel)) for reel in board]
+
+        # Hoist the bound-method lookup out of the per-cell loop
+        format_symbol = self.format_symbol
+        return [
+            list(map(format_symbol, reel, repeat(special_attributes))) for reel in board
+        ]
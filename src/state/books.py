@@ -7,12 +7,39 @@ for a single simulation round (spin).
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from src.events.filter import EventFilter
     from src.formatter import OutputFormatter
 
+# Immutable JSON scalars, returned as-is by _clone_event
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _clone_event(value: Any) -> Any:
+    """Copy an event payload built from dicts, lists and JSON scalars.
+
+    Events are JSON-shaped, so this skips deepcopy's memo table and
+    reduction machinery. Any other type falls back to deepcopy.
+
+    Args:
+        value: Event dict or nested value to copy
+
+    Returns:
+        Copy sharing no mutable containers with the input
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _clone_event(item) for key, item in value.items()}
+    if value_type is list:
+        return [_clone_event(item) for item in value]
+    if value_type in _ATOMIC_TYPES:
+        return value
+    if value_type is tuple:
+        return tuple([_clone_event(item) for item in value])
+    return deepcopy(value)
+
 
 class Book:
     """Stores simulation information for a single spin.
@@ -29,14 +56,29 @@ class Book:
         free_game_wins: Total wins from free spins
         formatter: Optional OutputFormatter for format versioning
         event_filter: Optional EventFilter for selective event inclusion
+        copy_on_add: Whether add_event stores a copy of each event
     """
 
+    __slots__ = (
+        "id",
+        "payout_multiplier",
+        "events",
+        "criteria",
+        "base_game_wins",
+        "free_game_wins",
+        "formatter",
+        "event_filter",
+        "copy_on_add",
+        "_filter_fn",
+    )
+
     def __init__(
         self,
         book_id: int,
         criteria: str,
         formatter: OutputFormatter | None = None,
         event_filter: EventFilter | None = None,
+        copy_on_add: bool = True,
     ) -> None:
         """Initialize simulation book.
 
@@ -45,6 +87,8 @@ class Book:
             criteria: Simulation criteria/mode
             formatter: Optional OutputFormatter for format versioning
             event_filter: Optional EventFilter for selective event emission
+            copy_on_add: Copy each event on add. Only disable it when every
+                event producer has been audited to build fresh containers
         """
         self.id: int = book_id
         self.payout_multiplier: float = 0.0
@@ -54,6 +98,32 @@ class Book:
         self.free_game_wins: float = 0.0
         self.formatter: OutputFormatter | None = formatter
         self.event_filter: EventFilter | None = event_filter
+        self.copy_on_add: bool = copy_on_add
+        # Bound filter check, or None when no configured filter can drop events
+        self._filter_fn: Callable[[str, dict[str, Any]], bool] | None = (
+            event_filter.should_include_event
+            if event_filter is not None and not event_filter.includes_all
+            else None
+        )
+
+    def reset(self, book_id: int, criteria: str) -> None:
+        """Reuse this book for a new simulation.
+
+        Clears per-spin results but keeps the formatter, event filter and
+        copy_on_add setting.
+        events is rebound rather than cleared in place, since the library
+        still references the previous list through to_json().
+
+        Args:
+            book_id: Unique identifier for the new simulation
+            criteria: Simulation criteria/mode
+        """
+        self.id = book_id
+        self.payout_multiplier = 0.0
+        self.events = []
+        self.criteria = criteria
+        self.base_game_wins = 0.0
+        self.free_game_wins = 0.0
 
     def add_event(self, event: dict[str, Any]) -> None:
         """Append event to book if it passes filtering.
@@ -64,16 +134,24 @@ class Book:
         Note:
             If an EventFilter is configured, the event will only be added
             if it passes the filter's should_include_event() check.
+
+            By default the event is copied, so callers may keep mutating
+            whatever they passed in. With copy_on_add disabled the book takes
+            ownership of the event as passed: producers must not embed live
+            game state containers (board, anticipation, positions) without
+            copying them first, and later changes go through
+            append_book_items().
         """
-        # Apply event filtering if filter is configured
-        if self.event_filter is not None:
+        # Apply event filtering if a filter that can drop events is configured
+        filter_fn = self._filter_fn
+        if filter_fn is not None:
             event_type = event.get("type")
-            if event_type and not self.event_filter.should_include_event(
-                event_type, event
-            ):
+            if event_type and not filter_fn(event_type, event):
                 return  # Skip this event
 
-        self.events.append(deepcopy(event))
+        if self.copy_on_add:
+            event = _clone_event(event)
+        self.events.append(event)
 
     def append_book_items(self, event_id: int, appended_info: dict[str, Any]) -> None:
         """Modify an existing book event at position 'event_id'.
@@ -82,8 +160,7 @@ class Book:
             event_id: Index of event to modify
             appended_info: Dictionary of fields to add/update in the event
         """
-        for key, value in appended_info.items():
-            self.events[event_id][key] = value
+        self.events[event_id].update(appended_info)
 
     def to_json(self) -> dict[str, Any]:
         """Return JSON-ready object.
@@ -96,7 +173,7 @@ class Book:
         """
         json_book: dict[str, Any] = {
             "id": self.id,
-            "payoutMultiplier": int(round(self.payout_multiplier * 100, 0)),
+            "payoutMultiplier": round(self.payout_multiplier * 100),
             "events": self.events,
             "criteria": self.criteria,
             "baseGameWins": self.base_game_wins,
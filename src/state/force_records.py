@@ -0,0 +1,48 @@
+"""Force-record bookkeeping for simulation results.
+
+Merges the force-record keys collected during a simulation into the
+running per-thread record table. The module has no GameState dependency
+so it can be compiled with mypyc (see MYPYC_MODULES in setup.py); the
+pure-Python version is used when no compiled build is present.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+ForceKey = tuple[tuple[str, str], ...]
+
+
+def imprint_force_records(
+    recorded_events: dict[ForceKey, dict[str, Any]],
+    temp_wins: list[ForceKey],
+    book_id: int,
+) -> list[ForceKey]:
+    """Merge the force keys recorded during one book into the record table.
+
+    Each key counts a book at most once. bookIds are kept as
+    insertion-ordered dict keys for O(1) membership checks.
+
+    Args:
+        recorded_events: Record table keyed by force key, updated in place
+        temp_wins: Force keys recorded for the current book
+        book_id: ID of the book the keys were recorded in
+
+    Returns:
+        Force keys seen for the first time, in the order they were recorded
+    """
+    new_keys: list[ForceKey] = []
+    for description in temp_wins:
+        recorded = recorded_events.get(description)
+        if recorded is None:
+            new_keys.append(description)
+            recorded_events[description] = {
+                "timesTriggered": 1,
+                "bookIds": {book_id: None},
+            }
+            continue
+        book_ids = recorded["bookIds"]
+        if book_id not in book_ids:
+            recorded["timesTriggered"] += 1
+            book_ids[book_id] = None
+    return new_keys
@@ -7,10 +7,12 @@ handling core simulation infrastructure, state queries, and common game actions.
 from __future__ import annotations
 
 import random
+import zlib
 from abc import ABC, abstractmethod
-from copy import copy
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable, Optional
-from warnings import warn
+
+import numpy as np
 
 from src.calculations.symbol import SymbolStorage
 from src.config.output import OutputFiles
@@ -26,6 +28,7 @@ from src.events.tumble import set_win_event, tumble_event
 from src.exceptions import GameConfigError, SimulationError
 from src.formatter import OutputFormatter
 from src.state.books import Book
+from src.state.force_records import ForceKey, imprint_force_records
 from src.types import Board, Event, SimulationID
 from src.wins.manager import WinManager
 from src.writers.data import (
@@ -39,7 +42,26 @@ from src.writers.data import (
 if TYPE_CHECKING:
     from src.config.bet_mode import BetMode
     from src.config.config import Config
-    from src.config.distribution import Distribution
+    from src.config.distribution import Distribution, DistributionFlags
+
+
+@lru_cache(maxsize=2048)
+def _freeze_description(
+    items: tuple[tuple[Any, Any], ...], value_types: tuple[type, ...]
+) -> tuple[tuple[str, str], ...]:
+    """Convert description items to the sorted string-pair form used as a force key.
+
+    value_types is part of the cache key only, so values that compare equal
+    but stringify differently (1, 1.0, True) never share an entry. Keys and
+    values that are already strings are passed through without str().
+    """
+    frozen = {
+        key if type(key) is str else str(key): (
+            value if type(value) is str else str(value)
+        )
+        for key, value in items
+    }
+    return tuple(sorted(frozen.items()))
 
 
 class GameState(ABC):
@@ -65,8 +87,10 @@ class GameState(ABC):
         win_manager: Win tracking and aggregation
         library: Dictionary of all simulation results
         recorded_events: Force record tracking
+        temp_wins: Force-record keys pending for the current book
         special_symbol_functions: Symbol-specific handlers
         sim: Current simulation ID
+        rng: Per-instance stdlib RNG, reseeded for every simulation
         criteria: Current force criteria
         book: Current simulation book
         board: Current board state
@@ -75,6 +99,51 @@ class GameState(ABC):
         total_free_spins: Total free spins awarded
     """
 
+    # Core per-spin state lives in slots for faster attribute access.
+    # Subclasses do not declare __slots__, so game-specific state still
+    # goes into the instance __dict__.
+    __slots__ = (
+        "config",
+        "output_files",
+        "win_manager",
+        "library",
+        "recorded_events",
+        "special_symbol_functions",
+        "temp_wins",
+        "symbol_storage",
+        "sim",
+        "criteria",
+        "book",
+        "book_id",
+        "repeat",
+        "win_data",
+        "board",
+        "top_symbols",
+        "bottom_symbols",
+        "anticipation",
+        "global_multiplier",
+        "final_win",
+        "total_free_spins",
+        "free_spin_count",
+        "wincap_triggered",
+        "triggered_free_game",
+        "game_type",
+        "bet_mode",
+        "num_sims",
+        "_repeat_count",
+        "rng",
+        "_batch_rng",
+        "_rand_buf",
+        "_rand_cursor",
+        "_formatter",
+        "_event_filter",
+        "_empty_reels",
+        "_bet_mode_by_name",
+        "_dist_cache",
+        "_min_trigger_by_game_type",
+        "_special_kinds_by_symbol",
+    )
+
     def __init__(self, config: Config) -> None:
         """Initialize game state with configuration.
 
@@ -89,13 +158,51 @@ class GameState(ABC):
         self.library: dict[int, dict[str, Any]] = {}
         self.recorded_events: dict[tuple[tuple[str, str], ...], dict[str, Any]] = {}
         self.special_symbol_functions: dict[str, list[Callable[[Any], None]]] = {}
-        self.temp_wins: list[Any] = []
+        self._bet_mode_by_name: dict[str, BetMode] = {
+            bet_mode.get_name(): bet_mode for bet_mode in self.config.bet_modes
+        }
+        self._dist_cache: dict[
+            tuple[str, str], tuple[Distribution, dict[str, Any], DistributionFlags]
+        ] = {}
+        # Smallest scatter count that awards free spins, per game type
+        self._min_trigger_by_game_type: dict[str, int] = {
+            game_type: min(triggers)
+            for game_type, triggers in self.config.free_spin_triggers.items()
+        }
+        self.temp_wins: list[ForceKey] = []
+        self.rng: random.Random = random.Random()
+        self._batch_rng: np.random.Generator | None = None
+        self._rand_buf: list[float] = []
+        self._rand_cursor: int = 0
         self.create_symbol_map()
         self.assign_special_symbol_functions()
         self.sim: SimulationID = 0
         self.criteria: str = ""
-        self.book: Book = Book(self.sim, self.criteria)
+        # Formatter and filter are stateless across books; build them once
+        # from config for format versioning and selective event emission
+        self._formatter: OutputFormatter = OutputFormatter(
+            output_mode=self.config.output_mode,
+            include_losing_boards=self.config.include_losing_boards,
+            compress_positions=self.config.compress_positions,
+            simple_symbols=self.config.simple_symbols,
+            skip_implicit_events=self.config.skip_implicit_events,
+        )
+        self._event_filter: EventFilter = EventFilter(self.config)
+        self.book: Book = Book(
+            self.sim,
+            self.criteria,
+            self._formatter,
+            self._event_filter,
+            copy_on_add=self.config.copy_book_events,
+        )
         self.repeat: bool = True
+        # Placeholder reels copied into self.board on reset. draw_board always
+        # rebinds the board and cells are only ever replaced, never mutated,
+        # so every row can share one empty list
+        self._empty_reels: Board = [
+            [[]] * self.config.num_rows[reel]  # type: ignore[attr-defined]
+            for reel in range(self.config.num_reels)  # type: ignore[attr-defined]
+        ]
         self.win_data: dict[str, Any] = {
             "totalWin": 0,
             "wins": [],
@@ -110,17 +217,22 @@ class GameState(ABC):
 
     def create_symbol_map(self) -> None:
         """Construct all valid symbols from config file (from pay-table and special symbols)."""
-        all_symbols_set: set[str] = set()
-        for key, _ in self.config.paytable.items():
-            all_symbols_set.add(key[1])
-
-        for key in self.config.special_symbols:
-            for sym in self.config.special_symbols[key]:
-                all_symbols_set.add(sym)
-
+        all_symbols_set: set[str] = {key[1] for key in self.config.paytable}.union(
+            *self.config.special_symbols.values()
+        )
         all_symbols_list: list[str] = list(all_symbols_set)
         self.symbol_storage = SymbolStorage(self.config, all_symbols_list)
 
+        # Special-symbol kinds per symbol name, in config order, so board
+        # scans resolve a symbol's kinds with one dict lookup
+        special_kinds: dict[str, list[str]] = {}
+        for kind, names in self.config.special_symbols.items():
+            for name in names:
+                special_kinds.setdefault(name, []).append(kind)
+        self._special_kinds_by_symbol: dict[str, tuple[str, ...]] = {
+            name: tuple(kinds) for name, kinds in special_kinds.items()
+        }
+
     @abstractmethod
     def assign_special_symbol_functions(self) -> None:
         """Define custom symbol functions in game implementation.
@@ -134,8 +246,11 @@ class GameState(ABC):
             ...         "M": [self.assign_multiplier_property],
             ...         "W": [self.apply_wild_expansion]
             ...     }
+
+        Note:
+            Enforced by @abstractmethod; games without special symbols
+            should override it with an empty body.
         """
-        warn("No special symbol functions are defined")
 
     def reset_book(self) -> None:
         """Reset all state variables for a new simulation.
@@ -151,28 +266,13 @@ class GameState(ABC):
             self._raise_repeat_limit_error()
         self._repeat_count += 1
 
-        self.temp_wins = []
-        self.board: Board = [
-            [[] for _ in range(self.config.num_rows[reel])]  # type: ignore[attr-defined]
-            for reel in range(self.config.num_reels)  # type: ignore[attr-defined]
-        ]
+        self.temp_wins.clear()
+        self.board: Board = [reel.copy() for reel in self._empty_reels]
         self.top_symbols = None
         self.bottom_symbols = None
         self.book_id = self.sim + 1
 
-        # Create OutputFormatter from config for format versioning
-        formatter = OutputFormatter(
-            output_mode=self.config.output_mode,
-            include_losing_boards=self.config.include_losing_boards,
-            compress_positions=self.config.compress_positions,
-            simple_symbols=self.config.simple_symbols,
-            skip_implicit_events=self.config.skip_implicit_events,
-        )
-
-        # Create EventFilter from config for selective event emission (Phase 3.2)
-        event_filter = EventFilter(self.config)
-
-        self.book = Book(self.book_id, self.criteria, formatter, event_filter)
+        self.book.reset(self.book_id, self.criteria)
         self.win_data = {
             "totalWin": 0,
             "wins": [],
@@ -189,17 +289,70 @@ class GameState(ABC):
         self.anticipation = [0] * self.config.num_reels  # type: ignore[attr-defined]
 
     MAX_REPEAT_ATTEMPTS: int = 10_000
+    RAND_BATCH_SIZE: int = 4096
 
     def reset_seed(self, sim: SimulationID = 0) -> None:
         """Reset RNG seed to simulation number for reproducibility.
 
+        All draws in the engine and bundled games go through self.rng, so
+        results do not depend on process-global state. Older game code that
+        calls the random module directly can set config.seed_global_random
+        to have it seeded alongside; new code should use self.rng.
+
+        When a batched RNG stream is active (config.batch_rng), the stream
+        is seeded once per (bet mode, thread, repeat) instead and is not
+        reset per simulation.
+
         Args:
             sim: Simulation ID to use as seed
         """
-        random.seed(sim + 1)
+        if self._batch_rng is None:
+            self.rng.seed(sim + 1)
+            if self.config.seed_global_random:
+                random.seed(sim + 1)
         self.sim = sim
         self._repeat_count: int = 0
 
+    def seed_batch_rng(self, seed: int) -> None:
+        """Seed the batched NumPy RNG stream used for reel stop draws.
+
+        self.rng (and the random module, when config.seed_global_random is
+        set) is seeded alongside so weighted draws stay reproducible for the
+        same seed.
+
+        Args:
+            seed: Seed for the PCG64 bit generator
+        """
+        self.rng.seed(seed)
+        if self.config.seed_global_random:
+            random.seed(seed)
+        self._batch_rng = np.random.Generator(np.random.PCG64(seed))
+        self._rand_buf = self._batch_rng.random(self.RAND_BATCH_SIZE).tolist()
+        self._rand_cursor = 0
+
+    def next_rand(self, upper: int) -> int:
+        """Draw a random integer in [0, upper) from the batched RNG stream.
+
+        Uniform floats are generated RAND_BATCH_SIZE at a time and kept as
+        a Python list, so each draw is a plain float read with no call into
+        the RNG and no NumPy scalar arithmetic.
+        Falls back to self.rng.randrange when no batched stream is seeded.
+
+        Args:
+            upper: Exclusive upper bound (e.g. reel strip length)
+
+        Returns:
+            Random integer in [0, upper)
+        """
+        if self._batch_rng is None:
+            return self.rng.randrange(0, upper)
+        if self._rand_cursor >= self.RAND_BATCH_SIZE:
+            self._rand_buf = self._batch_rng.random(self.RAND_BATCH_SIZE).tolist()
+            self._rand_cursor = 0
+        value = self._rand_buf[self._rand_cursor]
+        self._rand_cursor += 1
+        return int(value * upper)
+
     def reset_free_spin(self) -> None:
         """Reset state for free spin mode.
 
@@ -220,11 +373,10 @@ class GameState(ABC):
         Returns:
             BetMode object if found, None otherwise
         """
-        for bet_mode in self.config.bet_modes:
-            if bet_mode.get_name() == mode_name:
-                return bet_mode  # type: ignore[return-value]
-        print("\nWarning: bet_mode couldn't be retrieved\n")
-        return None
+        bet_mode = self._bet_mode_by_name.get(mode_name)
+        if bet_mode is None:
+            print("\nWarning: bet_mode couldn't be retrieved\n")
+        return bet_mode
 
     def get_current_bet_mode(self) -> Optional[BetMode]:
         """Get the currently active bet_mode.
@@ -232,39 +384,60 @@ class GameState(ABC):
         Returns:
             Current BetMode object if found, None otherwise
         """
-        for bet_mode in self.config.bet_modes:
-            if bet_mode.get_name() == self.bet_mode:
-                return bet_mode  # type: ignore[return-value]
-        return None
+        return self._bet_mode_by_name.get(self.bet_mode)
 
-    def get_current_bet_mode_distributions(self) -> Distribution:
-        """Get the current bet_mode's distribution for the active criteria.
+    def _get_dist_and_conditions(
+        self, lookup: str = "distribution"
+    ) -> tuple[Distribution, dict[str, Any], DistributionFlags]:
+        """Resolve the Distribution and its conditions for the current criteria.
+
+        Distributions are fixed once the config is built, so each
+        (bet_mode, criteria) pair is resolved through the bet mode's
+        criteria index once and served from a dict afterwards.
+
+        Args:
+            lookup: What the caller was looking up, used in the error message
 
         Returns:
-            Distribution object matching current criteria
+            Tuple of (Distribution, conditions dict, DistributionFlags)
 
         Raises:
-            RuntimeError: If criteria distribution cannot be found
+            GameConfigError: If the bet_mode or criteria cannot be found
         """
-        current_bet_mode = self.get_current_bet_mode()
-        if current_bet_mode is None:
+        key = (self.bet_mode, self.criteria)
+        cached = self._dist_cache.get(key)
+        if cached is not None:
+            return cached
+        bet_mode = self._bet_mode_by_name.get(self.bet_mode)
+        if bet_mode is None:
             available_modes = [bm.get_name() for bm in self.config.bet_modes]
             raise GameConfigError(
                 f"Could not locate bet_mode '{self.bet_mode}'. "
                 f"Available bet modes: {available_modes}. "
                 f"Check that self.bet_mode is set to a valid mode name."
             )
-        distributions = current_bet_mode.get_distributions()  # type: ignore[attr-defined]
-        for dist in distributions:
-            if dist._criteria == self.criteria:
-                return dist  # type: ignore[return-value]
-        available_criteria = [dist._criteria for dist in distributions]
+        dist = bet_mode.get_distribution(self.criteria)
+        if dist is not None:
+            cached = self._dist_cache[key] = (dist, dist._conditions, dist.get_flags())
+            return cached
+        available_criteria = [dist._criteria for dist in bet_mode.get_distributions()]
         raise GameConfigError(
-            f"Could not locate distribution for criteria '{self.criteria}' in bet_mode '{self.bet_mode}'. "
+            f"Could not locate {lookup} for criteria '{self.criteria}' in bet_mode '{self.bet_mode}'. "
             f"Available criteria: {available_criteria}. "
             f"Check your distribution configuration in game_config.py."
         )
 
+    def get_current_bet_mode_distributions(self) -> Distribution:
+        """Get the current bet_mode's distribution for the active criteria.
+
+        Returns:
+            Distribution object matching current criteria
+
+        Raises:
+            GameConfigError: If criteria distribution cannot be found
+        """
+        return self._get_dist_and_conditions("distribution")[0]
+
     def get_current_distribution_conditions(self) -> dict[str, Any]:
         """Get distribution conditions for the current criteria.
 
@@ -272,25 +445,20 @@ class GameState(ABC):
             Dictionary of distribution conditions (force_free game, win_criteria, etc.)
 
         Raises:
-            RuntimeError: If bet_mode conditions cannot be found
+            GameConfigError: If bet_mode conditions cannot be found
         """
-        bet_mode = self.get_bet_mode(self.bet_mode)
-        if bet_mode is None:
-            available_modes = [bm.get_name() for bm in self.config.bet_modes]
-            raise GameConfigError(
-                f"Could not locate bet_mode '{self.bet_mode}'. "
-                f"Available bet modes: {available_modes}. "
-                f"Check that self.bet_mode is set to a valid mode name."
-            )
-        for dist in bet_mode.get_distributions():  # type: ignore[attr-defined]
-            if dist._criteria == self.criteria:
-                return dist._conditions  # type: ignore[return-value]
-        available_criteria = [dist._criteria for dist in bet_mode.get_distributions()]
-        raise GameConfigError(
-            f"Could not locate conditions for criteria '{self.criteria}' in bet_mode '{self.bet_mode}'. "
-            f"Available criteria: {available_criteria}. "
-            f"Check your distribution configuration in game_config.py."
-        )
+        return self._get_dist_and_conditions("conditions")[1]
+
+    def get_current_distribution_flags(self) -> DistributionFlags:
+        """Get force_free_game/force_wincap for the active criteria as attributes.
+
+        Returns:
+            DistributionFlags for the current distribution
+
+        Raises:
+            GameConfigError: If bet_mode conditions cannot be found
+        """
+        return self._get_dist_and_conditions("conditions")[2]
 
     def record(self, description: dict[str, Any]) -> None:
         """Record an event for force distribution tracking.
@@ -310,11 +478,14 @@ class GameState(ABC):
             ...     "game_type": "base_game"
             ... })
         """
-        description_str: dict[str, str] = {}
-        for key, value in description.items():
-            description_str[str(key)] = str(value)
-        self.temp_wins.append(description_str)
-        self.temp_wins.append(self.book_id)
+        # Store the sorted key form up front so imprint_wins can use it directly.
+        # Descriptions recur across sims, so the conversion is memoized.
+        items = tuple(description.items())
+        try:
+            frozen = _freeze_description(items, tuple(map(type, description.values())))
+        except TypeError:  # unhashable value, convert without the cache
+            frozen = _freeze_description.__wrapped__(items, ())
+        self.temp_wins.append(frozen)
 
     def check_force_keys(self, description: tuple[tuple[str, str], ...]) -> None:
         """Check and append unique force-key parameters to bet_mode.
@@ -325,10 +496,9 @@ class GameState(ABC):
         current_bet_mode = self.get_current_bet_mode()
         if current_bet_mode is None:
             return
-        current_mode_force_keys = current_bet_mode.get_force_keys()  # type: ignore[attr-defined]
         for key_value in description:
-            if key_value[0] not in current_mode_force_keys:
-                current_bet_mode.add_force_key(key_value[0])  # type: ignore[attr-defined]
+            if not current_bet_mode.has_force_key(key_value[0]):
+                current_bet_mode.add_force_key(key_value[0])
 
     def combine(self, modes: list[list[BetMode]], bet_mode_name: str) -> None:
         """Combine force record keys across multiple mode configurations.
@@ -337,18 +507,16 @@ class GameState(ABC):
             modes: List of bet_mode configuration lists
             bet_mode_name: Name of the bet_mode to combine keys for
         """
+        target_bet_mode = self.get_bet_mode(bet_mode_name)
+        if target_bet_mode is None:
+            return
         for mode_config in modes:
             for bet_mode in mode_config:
                 if bet_mode.get_name() == bet_mode_name:
                     break
-            force_keys = bet_mode.get_force_keys()  # type: ignore[attr-defined]
-            target_bet_mode = self.get_bet_mode(bet_mode_name)
-            if target_bet_mode is None:
-                continue
-            for key in force_keys:
-                target_force_keys = target_bet_mode.get_force_keys()  # type: ignore[attr-defined]
-                if key not in target_force_keys:
-                    target_bet_mode.add_force_key(key)  # type: ignore[attr-defined]
+            for key in bet_mode.get_force_keys():
+                if not target_bet_mode.has_force_key(key):
+                    target_bet_mode.add_force_key(key)
 
     def imprint_wins(self) -> None:
         """Record all tracked events to library and update win statistics.
@@ -357,22 +525,13 @@ class GameState(ABC):
         the completed simulation in the library. Also updates cumulative
         win tracking in the win manager.
         """
-        for temp_win_index in range(int(len(self.temp_wins) / 2)):
-            description = tuple(sorted(self.temp_wins[2 * temp_win_index].items()))
-            book_id = self.temp_wins[2 * temp_win_index + 1]
-            if description in self.recorded_events and (
-                book_id not in self.recorded_events[description]["bookIds"]
-            ):
-                self.recorded_events[description]["timesTriggered"] += 1
-                self.recorded_events[description]["bookIds"] += [book_id]
-            elif description not in self.recorded_events:
-                self.check_force_keys(description)
-                self.recorded_events[description] = {
-                    "timesTriggered": 1,
-                    "bookIds": [book_id],
-                }
-        self.temp_wins = []
-        self.library[self.sim + 1] = copy(self.book.to_json())
+        new_keys = imprint_force_records(
+            self.recorded_events, self.temp_wins, self.book_id
+        )
+        for description in new_keys:
+            self.check_force_keys(description)
+        self.temp_wins.clear()
+        self.library[self.sim + 1] = self.book.to_json()
         self.win_manager.update_end_round_wins()
 
     def update_final_win(self) -> None:
@@ -384,26 +543,26 @@ class GameState(ABC):
         Raises:
             AssertionError: If win totals don't match between win_manager and book
         """
-        final = round(min(self.win_manager.running_bet_win, self.config.win_cap), 2)
-        base_win = round(min(self.win_manager.base_game_wins, self.config.win_cap), 2)
-        free_win = round(min(self.win_manager.free_game_wins, self.config.win_cap), 2)
+        win_manager = self.win_manager
+        win_cap = self.config.win_cap
+        final = round(min(win_manager.running_bet_win, win_cap), 2)
+        base_win = round(min(win_manager.base_game_wins, win_cap), 2)
+        free_win = round(min(win_manager.free_game_wins, win_cap), 2)
 
         self.final_win = final
-        self.book.payout_multiplier = self.final_win
+        self.book.payout_multiplier = final
         self.book.base_game_wins = base_win
         self.book.free_game_wins = free_win
 
-        assert min(
-            round(self.win_manager.base_game_wins + self.win_manager.free_game_wins, 2),
-            self.config.win_cap,
-        ) == round(
-            min(self.win_manager.running_bet_win, self.config.win_cap), 2
+        assert (
+            min(
+                round(win_manager.base_game_wins + win_manager.free_game_wins, 2),
+                win_cap,
+            )
+            == final
         ), "Base + Free game payout mismatch!"
-        assert min(
-            round(self.book.base_game_wins + self.book.free_game_wins, 2),
-            self.config.win_cap,
-        ) == min(
-            round(self.book.payout_multiplier, 2), round(self.config.win_cap, 2)
+        assert min(round(base_win + free_win, 2), win_cap) == min(
+            final, round(win_cap, 2)
         ), "Base + Free game payout mismatch!"
 
     def check_repeat(self) -> None:
@@ -418,8 +577,8 @@ class GameState(ABC):
             if win_criteria is not None and self.final_win != win_criteria:
                 self.repeat = True
 
-            conditions = self.get_current_distribution_conditions()
-            if conditions.get("force_free_game") and not self.triggered_free_game:
+            flags = self.get_current_distribution_flags()
+            if flags.force_free_game and not self.triggered_free_game:
                 self.repeat = True
 
     def _raise_repeat_limit_error(self) -> None:
@@ -486,10 +645,7 @@ class GameState(ABC):
         Returns:
             True if current criteria matches any of the provided args
         """
-        for arg in args:
-            if self.criteria == arg:
-                return True
-        return False
+        return self.criteria in args
 
     def in_mode(self, *args: str) -> bool:
         """Check if current bet-mode matches a given list.
@@ -500,10 +656,7 @@ class GameState(ABC):
         Returns:
             True if current bet_mode matches any of the provided args
         """
-        for arg in args:
-            if self.bet_mode == arg:
-                return True
-        return False
+        return self.bet_mode in args
 
     def is_wincap(self) -> bool:
         """Check if current base game + free game wins are >= max-win.
@@ -511,9 +664,7 @@ class GameState(ABC):
         Returns:
             True if wincap has been reached or exceeded
         """
-        if self.win_manager.running_bet_win >= self.config.win_cap:
-            return True
-        return False
+        return self.win_manager.running_bet_win >= self.config.win_cap
 
     def is_in_game_type(self, *args: str) -> bool:
         """Check current game_type against possible list.
@@ -524,10 +675,7 @@ class GameState(ABC):
         Returns:
             True if current game_type matches any of the provided args
         """
-        for arg in args:
-            if self.game_type == arg:
-                return True
-        return False
+        return self.game_type in args
 
     def get_wincap_triggered(self) -> bool:
         """Check if max-win has been triggered.
@@ -535,9 +683,7 @@ class GameState(ABC):
         Returns:
             True if wincap flag is set
         """
-        if self.wincap_triggered:
-            return True
-        return False
+        return bool(self.wincap_triggered)
 
     # =========================================================================
     # COMMON GAME ACTIONS
@@ -571,9 +717,9 @@ class GameState(ABC):
         Returns:
             True if wincap was triggered, False otherwise
         """
-        if self.win_manager.running_bet_win >= self.config.win_cap and not (
-            self.wincap_triggered
-        ):
+        if self.wincap_triggered:
+            return False
+        if self.win_manager.running_bet_win >= self.config.win_cap:
             self.wincap_triggered = True
             win_cap_event(self)
             return True
@@ -588,9 +734,9 @@ class GameState(ABC):
         Returns:
             True if free spin trigger condition is met
         """
-        if self.count_special_symbols(scatter_key) >= min(
-            self.config.free_spin_triggers[self.game_type].keys()
-        ) and not (self.repeat):
+        if self.count_special_symbols(scatter_key) >= self._min_trigger_by_game_type[
+            self.game_type
+        ] and not (self.repeat):
             return True
         return False
 
@@ -603,9 +749,11 @@ class GameState(ABC):
         Returns:
             True if conditions allow free spin entry
         """
-        if self.get_current_distribution_conditions()["force_free_game"] and len(
-            self.special_symbols_on_board[scatter_key]
-        ) >= min(self.config.free_spin_triggers[self.game_type].keys()):
+        if (
+            self.get_current_distribution_flags().force_free_game
+            and len(self.special_symbols_on_board[scatter_key])
+            >= self._min_trigger_by_game_type[self.game_type]
+        ):
             return True
         self.repeat = True
         return False
@@ -743,7 +891,7 @@ class GameState(ABC):
         self,
         bet_mode_copy_list: list[list[BetMode]],
         bet_mode: str,
-        sim_to_criteria: dict[int, str],
+        sim_to_criteria: dict[int, str] | list[str],
         total_threads: int,
         total_repeats: int,
         num_sims: int,
@@ -761,7 +909,8 @@ class GameState(ABC):
         Args:
             bet_mode_copy_list: List to append bet_mode configurations to
             bet_mode: Name of the bet_mode being simulated
-            sim_to_criteria: Mapping from simulation ID to force criteria
+            sim_to_criteria: Force criteria by simulation ID (a dict, or a
+                list indexed from sim 0)
             total_threads: Total number of parallel threads
             total_repeats: Total number of repeat batches
             num_sims: Number of simulations per thread
@@ -779,12 +928,17 @@ class GameState(ABC):
         )
         self.bet_mode: str = bet_mode
         self.num_sims: int = num_sims
+        if self.config.batch_rng:
+            # Mix in the bet mode so modes sharing a thread and repeat draw
+            # independent streams (crc32 is stable across processes, unlike hash)
+            mode_key = zlib.crc32(bet_mode.encode("utf-8"))
+            self.seed_batch_rng(
+                (mode_key << 64) + thread_index * 10_000_019 + repeat_count
+            )
 
         # Calculate simulation range for this thread
-        start_sim = thread_index * num_sims + (total_threads * num_sims) * repeat_count
-        end_sim = (thread_index + 1) * num_sims + (
-            total_threads * num_sims
-        ) * repeat_count
+        start_sim = thread_index * num_sims + total_threads * num_sims * repeat_count
+        end_sim = start_sim + num_sims
 
         for sim in range(start_sim, end_sim):
             self.criteria = sim_to_criteria[sim]
@@ -837,5 +991,5 @@ class GameState(ABC):
         )
 
         if write_event_list:
-            write_library_events(self, list(self.library.values()), bet_mode)
+            write_library_events(self, self.library.values(), bet_mode)
         bet_mode_copy_list.append(self.config.bet_modes)
@@ -1,10 +1,14 @@
 import asyncio
 import cProfile
+import multiprocessing
+import pickle
 import random
 import shutil
+import sys
 import time
-from multiprocessing import Manager, Process
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, List
 from warnings import warn
 
 from src.writers.data import output_lookup_and_force_files
@@ -77,28 +81,79 @@ def get_sim_splits(
     reduce_sims = total_sims > num_sims
     criteria_list = [dist._criteria for dist in bet_mode_distributions]
     criteria_weights = [dist._quota for dist in bet_mode_distributions]
+    # Rounding leaves total_sims off by at most one per distribution, so
+    # this loop is short; keep the seeded draws so splits stay reproducible
     random.seed(0)
-    while sum(num_sims_criteria.values()) != num_sims:
+    while total_sims != num_sims:
         criteria = random.choices(criteria_list, criteria_weights)[0]
         if reduce_sims and num_sims_criteria[criteria] > 1:
             num_sims_criteria[criteria] -= 1
+            total_sims -= 1
         elif not reduce_sims:
             num_sims_criteria[criteria] += 1
+            total_sims += 1
 
     return num_sims_criteria
 
 
-def assign_sim_criteria(num_sims_criteria: Dict[str, int], sims: int) -> Dict[int, str]:
-    """Assign criteria randomly to simulations based on quota defined in config."""
+def assign_sim_criteria(num_sims_criteria: Dict[str, int], sims: int) -> List[str]:
+    """Assign criteria randomly to simulations based on quota defined in config.
+
+    Returns a list indexed by simulation number. Sim ids run from 0, so the
+    list serves the same lookups as a {sim: criteria} dict without a hash
+    entry and boxed int key per simulation.
+    """
     sim_allocation = [
         criteria for criteria, count in num_sims_criteria.items() for _ in range(count)
     ]
     random.shuffle(sim_allocation)
-    return {i: sim_allocation[i] for i in range(min(sims, len(sim_allocation)))}
+    del sim_allocation[sims:]
+    return sim_allocation
+
+
+def get_thread_sim_range(
+    threads: int, sims_per_thread: int, thread_index: int, repeat: int
+) -> range:
+    """Simulation numbers handled by one thread in one repeat batch."""
+    start_sim = thread_index * sims_per_thread + (threads * sims_per_thread) * repeat
+    return range(start_sim, start_sim + sims_per_thread)
+
+
+# Pickled game state held by a worker process, set once by init_worker
+_worker_snapshot: bytes = b""
+
+
+def init_worker(game_state: object) -> None:
+    """Pool initializer: snapshot the game state once per worker.
+
+    Tasks then rebuild their copy from the local snapshot instead of the
+    parent pickling the whole game state and sending it with every task.
+    """
+    global _worker_snapshot
+    _worker_snapshot = pickle.dumps(game_state, pickle.HIGHEST_PROTOCOL)
+
+
+def run_sims_task(run_sims_args: tuple) -> list:
+    """Worker entry point: run one thread's batch and return its bet_mode configs.
+
+    Each task starts from a fresh copy of the snapshot, so game attributes
+    left over from the worker's previous batch never leak into this one.
+    """
+    game_state = pickle.loads(_worker_snapshot)
+    bet_mode_configs = []
+    game_state.run_sims(bet_mode_configs, *run_sims_args)
+    return bet_mode_configs
 
 
-async def profile_and_visualize(
-    game_id,
+def get_pool_context():
+    """Use fork on Linux so workers inherit the game state without pickling."""
+    if sys.platform == "linux":
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def profile_sims(
+    profiler,
     game_state,
     all_bet_mode_configs,
     bet_mode,
@@ -110,14 +165,16 @@ async def profile_and_visualize(
     compress,
     write_event_list,
 ):
-    """Create flame-graph, automatically opens output on localhost."""
-    output_string = f"games/{game_id}/simulationProfile_{bet_mode}.prof"
-    cProfile.runctx(
+    """Run one batch under the profiler; stats accumulate across batches."""
+    profiler.runctx(
         "game_state.run_sims(all_bet_mode_configs, bet_mode, sim_allocation, threads, num_repeats, sims_per_thread, 0, repeat, compress, write_event_list)",
         globals(),
         locals(),
-        output_string,
     )
+
+
+async def visualize_profile(output_string):
+    """Open the flame-graph on localhost."""
     await asyncio.create_subprocess_exec("snakeviz", output_string)
 
 
@@ -138,15 +195,26 @@ def run_multi_process_sims(
     sims_per_thread = int(num_sims / threads / num_repeats)
     num_sims_criteria = get_sim_splits(game_state, num_sims, bet_mode)
     sim_allocation = assign_sim_criteria(num_sims_criteria, num_sims)
-    for repeat in range(num_repeats):
-        print("Batch", repeat + 1, "of", num_repeats)
-        processes = []
-        manager = Manager()
-        all_bet_mode_configs = manager.list()
-        if profiling:
-            asyncio.run(
-                profile_and_visualize(
-                    game_id=game_id,
+    # One profiler spans every batch; snakeviz opens once all batches finish
+    profiler = cProfile.Profile() if profiling else None
+    # Single-threaded runs simulate in-process, so skip the pool's queues and pipes
+    pool = (
+        ProcessPoolExecutor(
+            max_workers=threads,
+            mp_context=get_pool_context(),
+            initializer=init_worker,
+            initargs=(game_state,),
+        )
+        if threads > 1
+        else nullcontext()
+    )
+    with pool as executor:
+        for repeat in range(num_repeats):
+            print("Batch", repeat + 1, "of", num_repeats)
+            all_bet_mode_configs = []
+            if profiling:
+                profile_sims(
+                    profiler=profiler,
                     game_state=game_state,
                     all_bet_mode_configs=all_bet_mode_configs,
                     bet_mode=bet_mode,
@@ -158,43 +226,54 @@ def run_multi_process_sims(
                     compress=compress,
                     write_event_list=write_event_list,
                 )
-            )
-        elif threads == 1:
-            game_state.run_sims(
-                all_bet_mode_configs,
-                bet_mode,
-                sim_allocation,
-                threads,
-                num_repeats,
-                sims_per_thread,
-                0,
-                repeat,
-                compress,
-                write_event_list,
-            )
-        else:
-            for thread in range(threads):
-                process = Process(
-                    target=game_state.run_sims,
-                    args=(
-                        all_bet_mode_configs,
-                        bet_mode,
-                        sim_allocation,
-                        threads,
-                        num_repeats,
-                        sims_per_thread,
-                        thread,
-                        repeat,
-                        compress,
-                        write_event_list,
-                    ),
+            elif threads == 1:
+                game_state.run_sims(
+                    all_bet_mode_configs,
+                    bet_mode,
+                    sim_allocation,
+                    threads,
+                    num_repeats,
+                    sims_per_thread,
+                    0,
+                    repeat,
+                    compress,
+                    write_event_list,
                 )
-                print("Started thread", thread)
-                process.start()
-                processes += [process]
-            print("All threads are online.")
-            for process in processes:
-                process.join()
-            print("Finished joining threads.")
-            game_state.combine(all_bet_mode_configs, bet_mode)
-            game_state.get_bet_mode(bet_mode).lock_force_keys()
+            else:
+                futures = []
+                for thread in range(threads):
+                    # Only ship the criteria this thread needs, not the full allocation
+                    thread_allocation = {
+                        sim: sim_allocation[sim]
+                        for sim in get_thread_sim_range(
+                            threads, sims_per_thread, thread, repeat
+                        )
+                    }
+                    futures.append(
+                        executor.submit(
+                            run_sims_task,
+                            (
+                                bet_mode,
+                                thread_allocation,
+                                threads,
+                                num_repeats,
+                                sims_per_thread,
+                                thread,
+                                repeat,
+                                compress,
+                                write_event_list,
+                            ),
+                        )
+                    )
+                    print("Started thread", thread)
+                print("All threads are online.")
+                for future in futures:
+                    all_bet_mode_configs.extend(future.result())
+                print("Finished joining threads.")
+                game_state.combine(all_bet_mode_configs, bet_mode)
+                game_state.get_bet_mode(bet_mode).lock_force_keys()
+
+    if profiler is not None:
+        output_string = f"games/{game_id}/simulationProfile_{bet_mode}.prof"
+        profiler.dump_stats(output_string)
+        asyncio.run(visualize_profile(output_string))
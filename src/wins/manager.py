@@ -30,6 +30,21 @@ class WinManager:
         tumble_win: Current tumble win amount
     """
 
+    __slots__ = (
+        "base_game_mode",
+        "free_game_mode",
+        "_base_game_key",
+        "_free_game_key",
+        "total_cumulative_wins",
+        "cumulative_base_wins",
+        "cumulative_free_wins",
+        "running_bet_win",
+        "base_game_wins",
+        "free_game_wins",
+        "spin_win",
+        "tumble_win",
+    )
+
     def __init__(self, base_game_mode: str, free_game_mode: str) -> None:
         """Initialize win manager with game mode names.
 
@@ -39,6 +54,9 @@ class WinManager:
         """
         self.base_game_mode: str = base_game_mode
         self.free_game_mode: str = free_game_mode
+        # Lower-cased once; update_game_type_wins compares against them per spin
+        self._base_game_key: str = base_game_mode.lower()
+        self._free_game_key: str = free_game_mode.lower()
 
         # Updates win amounts across all simulations
         self.total_cumulative_wins: float = 0.0
@@ -94,18 +112,54 @@ class WinManager:
             game_type: Game mode name (should match base_game_mode or free_game_mode)
 
         Raises:
-            RuntimeError: If game_type doesn't match either game mode
+            SimulationError: If game_type doesn't match either game mode
         """
-        if self.base_game_mode.lower() == game_type.lower():
+        game_type_key = game_type.lower()
+        if game_type_key == self._base_game_key:
             self.base_game_wins += self.spin_win
-        elif self.free_game_mode.lower() == game_type.lower():
+        elif game_type_key == self._free_game_key:
             self.free_game_wins += self.spin_win
         else:
-            raise SimulationError(
-                f"Invalid game_type '{game_type}'. "
-                f"Valid game_types are: '{self.base_game_mode}' (base) or '{self.free_game_mode}' (free). "
-                f"Check that your game state's 'game_type' attribute is set correctly."
-            )
+            raise self._invalid_game_type(game_type)
+
+    def update_spin_and_game_type_wins(self, win_amount: float, game_type: str) -> None:
+        """Add a win to the current spin and assign the spin to a game type.
+
+        Same result as update_spin_win(win_amount) followed by
+        update_game_type_wins(game_type), in a single call.
+
+        Args:
+            win_amount: Amount to add to current spin/reveal win
+            game_type: Game mode name (should match base_game_mode or free_game_mode)
+
+        Raises:
+            SimulationError: If game_type doesn't match either game mode
+        """
+        spin_win = self.spin_win + win_amount
+        self.spin_win = spin_win
+        self.running_bet_win += win_amount
+        game_type_key = game_type.lower()
+        if game_type_key == self._base_game_key:
+            self.base_game_wins += spin_win
+        elif game_type_key == self._free_game_key:
+            self.free_game_wins += spin_win
+        else:
+            raise self._invalid_game_type(game_type)
+
+    def _invalid_game_type(self, game_type: str) -> SimulationError:
+        """Build the error raised for a game_type matching neither game mode.
+
+        Args:
+            game_type: Offending game mode name
+
+        Returns:
+            SimulationError describing the valid game types
+        """
+        return SimulationError(
+            f"Invalid game_type '{game_type}'. "
+            f"Valid game_types are: '{self.base_game_mode}' (base) or '{self.free_game_mode}' (free). "
+            f"Check that your game state's 'game_type' attribute is set correctly."
+        )
 
     def update_end_round_wins(self) -> None:
         """Accumulate total wins for a given betting round.
@@ -113,9 +167,11 @@ class WinManager:
         Adds the current simulation's base and free game wins to the
         cumulative totals across all simulations.
         """
-        self.total_cumulative_wins += self.base_game_wins + self.free_game_wins
-        self.cumulative_base_wins += self.base_game_wins
-        self.cumulative_free_wins += self.free_game_wins
+        base_game_wins = self.base_game_wins
+        free_game_wins = self.free_game_wins
+        self.total_cumulative_wins += base_game_wins + free_game_wins
+        self.cumulative_base_wins += base_game_wins
+        self.cumulative_free_wins += free_game_wins
 
     def reset_end_round_wins(self) -> None:
         """Reset all wins at end of game round/simulation.
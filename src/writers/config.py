@@ -88,9 +88,6 @@ def make_temp_math_config(game_state):
     which is directly compatible with with existing optimization script. Will be reformatted
     when the new algorithm is implemented.
     """
-    file = open(
-        game_state.output_files.configs["paths"]["math_config"], "w", encoding="UTF-8"
-    )
     jsonInfo = {}
     jsonInfo["game_id"] = game_state.config.game_id
     jsonInfo["bet_modes"] = []
@@ -99,28 +96,26 @@ def make_temp_math_config(game_state):
     rust_dict = {}
     rust_dict["game_id"] = jsonInfo["game_id"]
     rust_dict["bet_modes"] = []
+    rust_dict["fences"] = []
+    rust_dict["dresses"] = []
 
     # Separated bet_mode information
-    optimization_mode = None
+    optimization_params = game_state.config.optimization_params
     for bet_mode in game_state.config.bet_modes:
-        for mode, mode_obj in game_state.config.optimization_params.items():
-            if mode == bet_mode.get_name():
-                optimization_mode = mode
-                break
+        mode_name = bet_mode.get_name()
+        mode_obj = optimization_params.get(mode_name)
 
-        if optimization_mode is not None:
+        if mode_obj is not None:
             bet_mode_rust = {
-                "bet_mode": bet_mode.get_name(),
+                "bet_mode": mode_name,
                 "cost": bet_mode.get_cost(),
                 "rtp": bet_mode.get_rtp(),
                 "maxWin": bet_mode.get_win_cap(),
             }
-            rust_dict["bet_modes"] += [bet_mode_rust]
+            rust_dict["bet_modes"].append(bet_mode_rust)
             jsonInfo["bet_modes"].append(bet_mode_rust)
 
-            rust_dict["fences"] = []
-            rust_fence = {"bet_mode": bet_mode.get_name(), "fences": []}
-            fence_info = {}
+            rust_fence = {"bet_mode": mode_name, "fences": []}
             for fence, fence_obj in mode_obj["conditions"].items():
                 fence_info = {}
                 fence_info["name"] = fence
@@ -149,12 +144,11 @@ def make_temp_math_config(game_state):
                 ][1]
                 fence_info["identity_condition"]["opposite"] = False
 
-                rust_fence["fences"] += [fence_info]
-            rust_dict["fences"] += [rust_fence]
+                rust_fence["fences"].append(fence_info)
+            rust_dict["fences"].append(rust_fence)
             jsonInfo["fences"].append(rust_fence)
 
-            rust_dict["dresses"] = []
-            rust_dress = {"bet_mode": bet_mode.get_name(), "dresses": []}
+            rust_dress = {"bet_mode": mode_name, "dresses": []}
             for dress_obj in mode_obj["scaling"]:
                 dress_info = {}
                 dress_info["fence"] = dress_obj["criteria"]
@@ -167,11 +161,13 @@ def make_temp_math_config(game_state):
 
                 rust_dress["dresses"].append(dress_info)
 
-            rust_dict["dresses"] += [rust_dress]
+            rust_dict["dresses"].append(rust_dress)
             jsonInfo["dresses"].append(rust_dress)
 
-    file.write(json.dumps(jsonInfo, indent=4))
-    file.close()
+    with open(
+        game_state.output_files.configs["paths"]["math_config"], "w", encoding="UTF-8"
+    ) as f:
+        f.write(json.dumps(jsonInfo, indent=4))
 
 
 def make_math_config(game_state):
@@ -182,19 +178,17 @@ def make_math_config(game_state):
     rust_dict = {}
     rust_dict["game_name"] = jsonInfo["gameID"]
     rust_dict["bet_modes"] = []
+    optimization_params = game_state.config.optimization_params
     for bet_mode in game_state.config.bet_modes:
+        mode_name = bet_mode.get_name()
         bet_mode_rust = {
-            "bet_mode": bet_mode.get_name(),
+            "bet_mode": mode_name,
             "cost": bet_mode.get_cost(),
             "rtp": bet_mode.get_rtp(),
             "maxWin": bet_mode.get_win_cap(),
         }
-        optimization_mode = None
-        for mode, mode_obj in game_state.config.optimization_params.items():
-            if mode == bet_mode.get_name():
-                optimization_mode = mode
-                break
-        if optimization_mode is not None:
+        mode_obj = optimization_params.get(mode_name)
+        if mode_obj is not None:
 
             data = []
             search_data = []
@@ -244,9 +238,12 @@ def make_math_config(game_state):
 
             rust_dict["bet_modes"].append(bet_mode_rust)
 
-            file = open(game_state.config.config_path + "/math_config.json", "w")
-            file.write(json.dumps(rust_dict, indent=4))
-            file.close()
+            with open(
+                game_state.config.config_path + "/math_config.json",
+                "w",
+                encoding="UTF-8",
+            ) as f:
+                f.write(json.dumps(rust_dict, indent=4))
 
 
 def make_fe_config(game_state, json_padding=True, assign_properties=True, **kwargs):
@@ -326,9 +323,8 @@ def make_fe_config(game_state, json_padding=True, assign_properties=True, **kwar
         game_state.output_files.config_path,
         "game_config.json",
     )
-    fe_json = open(f_name, "w", encoding="UTF-8")
-    fe_json.write(json.dumps(json_info, indent=4))
-    fe_json.close()
+    with open(f_name, "w", encoding="UTF-8") as f:
+        f.write(json.dumps(json_info, indent=4))
 
 
 def make_be_config(game_state):
@@ -421,8 +417,7 @@ def make_be_config(game_state):
         }
         be_info["bookShelfConfig"].append(dic)
 
-    file = open(
+    with open(
         game_state.output_files.configs["paths"]["be_config"], "w", encoding="UTF-8"
-    )
-    file.write(json.dumps(be_info, indent=4))
-    file.close()
+    ) as f:
+        f.write(json.dumps(be_info, indent=4))
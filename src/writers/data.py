@@ -1,11 +1,11 @@
 """Handles writing all game game files"""
 
-import ast
 import hashlib
 import json
 import os
 import shutil
 from collections import defaultdict
+from collections.abc import Iterable
 from warnings import warn
 
 import zstandard as zstd
@@ -28,6 +28,24 @@ def get_sha_256(file_to_hash: str):
     return sha256_hexRep
 
 
+def open_books_writer(path: str, content_size: int = -1):
+    """Open a streaming, multi-threaded zstd writer for a books file.
+
+    Only the single-process final merge uses this, so it can take every
+    core. Passing the total uncompressed size keeps it in the frame header,
+    so the output can still be read with a one-shot
+    ZstdDecompressor().decompress().
+    """
+    compressor = zstd.ZstdCompressor(threads=-1)
+    return compressor.stream_writer(open(path, "wb"), size=content_size)
+
+
+def get_zstd_content_size(path: str) -> int:
+    """Return the uncompressed size stored in a zstd frame header (-1 if unknown)."""
+    with open(path, "rb") as f:
+        return zstd.frame_content_size(f.read(18))
+
+
 def make_force_json(game_state: object):
     """Construct force-file from recorded description keys."""
     folder_path = game_state.config.force_path
@@ -113,15 +131,16 @@ def make_lookup_pay_split(game_state: object, name: str):
     file.close()
 
 
-def write_library_events(game_state: object, library: list, game_type: str):
-    """Write all unique events within a given mode - with one example application."""
-    unique_event = []
+def write_library_events(game_state: object, library: Iterable, game_type: str):
+    """Write all unique events within a given mode - with one example application.
+
+    library is iterated once, so a dict values() view can be passed as is.
+    """
     event_items = {}
     for event in library:
         for instance in event["events"]:
             lib_event = instance["type"]
-            if lib_event not in unique_event:
-                unique_event.append(lib_event)
+            if lib_event not in event_items:
                 item_keys = instance.keys()
                 dict_details = {
                     key: instance[key] for key in item_keys if key != "index"
@@ -160,20 +179,16 @@ def output_lookup_and_force_files(
             )
 
     if compress:
-        temp_book_output_path = os.path.join(
-            game_state.output_files.book_path, "temp_book_output.json"
-        )
-        with open(temp_book_output_path, "w", encoding="UTF-8") as outfile:
+        # Stream each thread's books straight into a single multi-threaded
+        # compressor instead of round-tripping through an uncompressed file
+        content_sizes = [get_zstd_content_size(fname) for fname in file_list]
+        total_size = -1 if -1 in content_sizes else sum(content_sizes)
+        final_out = game_state.output_files.get_final_book_name(bet_mode, True)
+        decompressor = zstd.ZstdDecompressor()
+        with open_books_writer(final_out, total_size) as writer:
             for fname in file_list:
                 with open(fname, "rb") as infile:
-                    decompressed = zstd.ZstdDecompressor().decompress(infile.read())
-                    outfile.write(decompressed.decode("UTF-8"))
-
-        final_out = game_state.output_files.get_final_book_name(bet_mode, True)
-        with open(temp_book_output_path, "rb") as f_in, open(final_out, "wb") as f_out:
-            f_out.write(zstd.ZstdCompressor().compress(f_in.read()))
-
-        os.remove(temp_book_output_path)
+                    decompressor.copy_stream(infile, writer)
     else:
         # For uncompressed files, we need to properly merge JSON arrays
         all_books = []
@@ -248,15 +263,15 @@ def output_lookup_and_force_files(
             )
 
     for filename in file_list:
-        force_chunk = ast.literal_eval(json.load(open(filename, "r", encoding="UTF-8")))
-        for key in force_chunk:
+        with open(filename, "r", encoding="UTF-8") as f:
+            force_chunk = json.load(f)
+        for description, record in force_chunk:
+            key = tuple(tuple(pair) for pair in description)
             if force_results_dict.get(key) is not None:
-                force_results_dict[key]["timesTriggered"] += force_chunk[key][
-                    "timesTriggered"
-                ]
-                force_results_dict[key]["bookIds"] += force_chunk[key]["bookIds"]
+                force_results_dict[key]["timesTriggered"] += record["timesTriggered"]
+                force_results_dict[key]["bookIds"] += record["bookIds"]
             else:
-                force_results_dict[key] = force_chunk[key]
+                force_results_dict[key] = record
 
     force_results_dict_just_for_rob = []
     for force_combination in force_results_dict:
@@ -332,26 +347,36 @@ def output_lookup_and_force_files(
 
 def write_json(game_state, filename: str):
     """Convert the list of dictionaries to a JSON-encoded string and compress it in chunks."""
-    json_objects = [json.dumps(item) for item in game_state.library.values()]
-    combined_data = "\n".join(json_objects) + "\n"
+    books = game_state.library.values()
+    if not filename.endswith(".zst") and game_state.config.output_regular_json:
+        # Single JSON array; the JSON-lines form is never built in this mode
+        with open(filename, "w", encoding="UTF-8") as f:
+            f.write(json.dumps(list(books)))
+        return
 
+    combined_data = "\n".join(map(json.dumps, books)) + "\n"
     if filename.endswith(".zst"):
+        # Single-threaded: every simulation worker process writes its own
+        # temp books, so per-call zstd threads would oversubscribe the cores
         compressor = zstd.ZstdCompressor()
         compressed_data = compressor.compress(combined_data.encode("UTF-8"))
         with open(filename, "wb") as f:
             f.write(compressed_data)
     else:
         with open(filename, "w", encoding="UTF-8") as f:
-            if not (game_state.config.output_regular_json):
-                f.write(combined_data)
-            else:
-                j_regular = [item for item in game_state.library.values()]
-                f.write(json.dumps(j_regular))
+            f.write(combined_data)
 
 
 def print_recorded_wins(game_state: object, name: str = ""):
-    """Temporary file generation for wins/recorded results."""
-    json_object = json.dumps(str(game_state.recorded_events), indent=4)
-    file = open(name, "w", encoding="UTF-8")
-    file.write(json_object)
-    file.close()
+    """Temporary file generation for wins/recorded results.
+
+    Written as a JSON list of [description, record] pairs, since the tuple
+    description keys cannot be JSON object keys. bookIds are tracked as
+    insertion-ordered dict keys (an ordered set) and written as lists.
+    """
+    recorded_events = [
+        [description, {**record, "bookIds": list(record["bookIds"])}]
+        for description, record in game_state.recorded_events.items()
+    ]
+    with open(name, "w", encoding="UTF-8") as file:
+        json.dump(recorded_events, file)
@@ -1,7 +1,16 @@
 from src.exceptions import GameConfigError
 
 
+def _same_text(a, b) -> bool:
+    """Compare two values by their string form, skipping str() for strings."""
+    if type(a) is str and type(b) is str:
+        return a == b
+    return str(a) == str(b)
+
+
 class Option:
+    __slots__ = ("name", "value")
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
@@ -10,18 +19,20 @@ class Option:
         return {"name": self.name, "value": self.value}
 
     def __eq__(self, __value: object) -> bool:
-        if type(__value) == type(self):
-            return str(__value.name) == str(self.name) and str(__value.value) == str(
-                self.value
-            )
-        return False
+        if not isinstance(__value, Option):
+            return NotImplemented
+        return _same_text(__value.name, self.name) and _same_text(
+            __value.value, self.value
+        )
 
 
 class Search:
+    __slots__ = ("forceOptions",)
+
     def __init__(self, forceOptions=None):
         self.forceOptions: list[Option] = []
-        if not forceOptions == None:
-            if type(forceOptions) == dict:
+        if forceOptions is not None:
+            if isinstance(forceOptions, dict):
                 self.addOptionsDict(forceOptions)
             else:
                 self.forceOptions = forceOptions
@@ -34,21 +45,23 @@ class Search:
             self.addOption(Option(forceOption, forceOptions[forceOption]))
 
     def __eq__(self, __value: object) -> bool:
-        if type(__value) == self:
-            isEqual = True
-            for option1 in self.forceOptions:
-                for option2 in self.forceOptions:
-                    if option1.name == option2.name:
-                        if not (
-                            option1.value == option2.value
-                            or option1.value == None
-                            or option2.value == None
-                        ):
-                            isEqual = False
-                            break
-
-            return isEqual
-        return False
+        # Options sharing a name must agree unless either value is None (wildcard)
+        if not isinstance(__value, Search):
+            return NotImplemented
+        other_values = {option.name: option.value for option in __value.forceOptions}
+        for option in self.forceOptions:
+            if option.name in other_values:
+                other_value = other_values[option.name]
+                if not (
+                    option.value == other_value
+                    or option.value is None
+                    or other_value is None
+                ):
+                    return False
+        return True
+
+    # Wildcard matching is not transitive, so no hash can agree with __eq__
+    __hash__ = None  # type: ignore[assignment]
 
     def toJson(self):
         json_object = []
@@ -61,6 +74,8 @@ class Search:
 class IdentityCondition:
     """Return simulation ids which fulfil force-search or payout value conditions."""
 
+    __slots__ = ("search", "opposite", "win_range_start", "win_range_end")
+
     def __init__(self, search={}, opposite=False, win_amount=-1, win_range=(-1, -1)):
         if win_amount != -1:
             if win_range != (-1, -1):
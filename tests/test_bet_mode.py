@@ -0,0 +1,42 @@
+"""Unit tests for BetMode force-key tracking."""
+
+from src.config.bet_mode import BetMode
+
+
+def make_bet_mode() -> BetMode:
+    """Build a minimal bet mode with no distributions."""
+    return BetMode(
+        name="base",
+        cost=1.0,
+        rtp=0.97,
+        max_win=5000,
+        auto_close_disabled=False,
+        is_feature=True,
+        is_buy_bonus=False,
+        distributions=[],
+    )
+
+
+class TestBetModeForceKeys:
+    """Test suite for BetMode force keys."""
+
+    def test_has_force_key_tracks_added_keys(self):
+        """Test added keys are reported by has_force_key."""
+        bet_mode = make_bet_mode()
+
+        assert bet_mode.has_force_key("symbol") is False
+        bet_mode.add_force_key("symbol")
+
+        assert bet_mode.has_force_key("symbol") is True
+        assert bet_mode.get_force_keys() == ["symbol"]
+
+    def test_lock_keeps_membership(self):
+        """Test locking sorts the keys without losing membership."""
+        bet_mode = make_bet_mode()
+        bet_mode.add_force_key("symbol")
+        bet_mode.add_force_key("kind")
+
+        bet_mode.lock_force_keys()
+
+        assert bet_mode.get_force_keys() == ("kind", "symbol")
+        assert bet_mode.has_force_key("kind") is True
@@ -174,3 +174,48 @@ class TestBookEventFiltering:
         # JSON should only have 1 event (WIN)
         assert len(json_output["events"]) == 1
         assert json_output["events"][0]["type"] == EventConstants.WIN.value
+
+    def test_reset_keeps_filter_and_detaches_events(self):
+        """Test reset starts a fresh book without touching exported events."""
+        config = Config()
+        config.skip_derived_wins = True
+        event_filter = EventFilter(config)
+        book = Book(book_id=1, criteria="base", event_filter=event_filter)
+        book.add_event({"type": EventConstants.WIN.value, "amount": 10})
+        exported = book.to_json()
+
+        book.reset(2, "free")
+        book.add_event({"type": EventConstants.SHOW_WIN.value, "amount": 10})
+
+        assert book.id == 2
+        assert book.criteria == "free"
+        assert book.events == []  # SHOW_WIN still filtered after reset
+        assert len(exported["events"]) == 1
+
+    def test_add_event_stores_independent_copy(self):
+        """Test nested event payloads are copied by default."""
+        book = Book(book_id=1, criteria="base")
+        event = {
+            "type": EventConstants.REVEAL.value,
+            "board": [[{"name": "L5"}, {"name": "W"}]],
+            "anticipation": [0, 1],
+        }
+
+        book.add_event(event)
+        event["board"][0][0]["name"] = "H1"
+        event["anticipation"].append(2)
+
+        assert book.events[0]["board"] == [[{"name": "L5"}, {"name": "W"}]]
+        assert book.events[0]["anticipation"] == [0, 1]
+
+    def test_add_event_takes_ownership_when_copy_disabled(self):
+        """Test events are stored as passed when copy_on_add is off."""
+        book = Book(book_id=1, criteria="base", copy_on_add=False)
+        event = {"type": EventConstants.REVEAL.value, "anticipation": [0, 1]}
+
+        book.add_event(event)
+        book.reset(book_id=2, criteria="base")
+        book.add_event(event)
+
+        assert book.events[0] is event
+        assert book.copy_on_add is False
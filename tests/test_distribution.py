@@ -0,0 +1,31 @@
+"""Unit tests for Distribution condition flags."""
+
+from src.config.distribution import Distribution
+
+
+class TestDistributionFlags:
+    """Test suite for Distribution.get_flags."""
+
+    def test_flags_default_to_false(self):
+        """Test unset force conditions come through as False."""
+        dist = Distribution(
+            criteria="0", quota=0.1, conditions={"reel_weights": {"base_game": {}}}
+        )
+
+        flags = dist.get_flags()
+
+        assert flags.force_free_game is False
+        assert flags.force_wincap is False
+
+    def test_flags_follow_conditions(self):
+        """Test flags mirror the truthiness of the condition values."""
+        dist = Distribution(
+            criteria="free_game",
+            quota=0.1,
+            conditions={"reel_weights": {}, "force_free_game": True},
+        )
+
+        flags = dist.get_flags()
+
+        assert flags.force_free_game is True
+        assert flags.force_wincap is False
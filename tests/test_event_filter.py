@@ -16,6 +16,7 @@ class TestEventFilter:
         assert filter.skip_derived_wins is False
         assert filter.skip_progress_updates is False
         assert filter.verbose_event_level == "full"
+        assert filter.includes_all is True
 
     def test_init_with_custom_config(self):
         """Test EventFilter initialization with custom config."""
@@ -29,6 +30,7 @@ class TestEventFilter:
         assert filter.skip_derived_wins is True
         assert filter.skip_progress_updates is True
         assert filter.verbose_event_level == "minimal"
+        assert filter.includes_all is False
 
     def test_required_events_always_included(self):
         """Test that required events are always included regardless of settings."""
@@ -266,3 +268,22 @@ class TestEventFilter:
 
         # Required events included
         assert filter.should_include_event(EventConstants.WIN.value) is True
+
+    def test_type_decisions_cached_per_type(self):
+        """Test type-only outcomes are memoized without skipping context checks."""
+        config = Config()
+        config.verbose_event_level = "standard"
+        config.skip_implicit_events = True
+        filter = EventFilter(config)
+
+        assert filter.should_include_event(EventConstants.SET_WIN.value) is False
+        # A second lookup is served from the memo and must agree
+        assert filter.should_include_event(EventConstants.SET_WIN.value) is False
+        assert (
+            filter.should_include_event(EventConstants.SHOW_WIN.value, {"amount": 5})
+            is True
+        )
+        assert (
+            filter.should_include_event(EventConstants.SHOW_WIN.value, {"amount": 0})
+            is False
+        )
@@ -0,0 +1,31 @@
+"""Unit tests for force-record merging."""
+
+from src.state.force_records import imprint_force_records
+
+SCATTER_3 = (("game_type", "base_game"), ("kind", "3"), ("symbol", "scatter"))
+SCATTER_4 = (("game_type", "base_game"), ("kind", "4"), ("symbol", "scatter"))
+
+
+class TestImprintForceRecords:
+    """Test suite for imprint_force_records."""
+
+    def test_new_keys_are_recorded_and_returned(self):
+        """Test first-seen keys create records and are returned in order."""
+        recorded_events = {}
+
+        new_keys = imprint_force_records(recorded_events, [SCATTER_4, SCATTER_3], 1)
+
+        assert new_keys == [SCATTER_4, SCATTER_3]
+        assert recorded_events[SCATTER_3]["timesTriggered"] == 1
+        assert list(recorded_events[SCATTER_3]["bookIds"]) == [1]
+
+    def test_repeat_book_counted_once(self):
+        """Test a key recorded twice in one book only counts that book once."""
+        recorded_events = {}
+
+        imprint_force_records(recorded_events, [SCATTER_3, SCATTER_3], 1)
+        new_keys = imprint_force_records(recorded_events, [SCATTER_3], 2)
+
+        assert new_keys == []
+        assert recorded_events[SCATTER_3]["timesTriggered"] == 2
+        assert list(recorded_events[SCATTER_3]["bookIds"]) == [1, 2]
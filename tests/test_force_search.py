@@ -0,0 +1,41 @@
+"""Unit tests for force-file search matching."""
+
+from src.writers.force import Option, Search
+
+
+class TestSearchEquality:
+    """Test suite for Search.__eq__."""
+
+    def test_matching_options_are_equal(self):
+        """Test searches with the same option values compare equal."""
+        assert Search({"symbol": "scatter", "kind": 3}) == Search(
+            {"kind": 3, "symbol": "scatter"}
+        )
+
+    def test_conflicting_option_values_differ(self):
+        """Test a shared option with different values makes searches unequal."""
+        assert Search({"symbol": "scatter"}) != Search({"symbol": "wild"})
+
+    def test_none_value_acts_as_wildcard(self):
+        """Test a None value matches any value for the same option."""
+        assert Search({"symbol": None, "kind": 3}) == Search(
+            {"symbol": "scatter", "kind": 3}
+        )
+
+    def test_non_search_is_not_equal(self):
+        """Test comparing against another type is always unequal."""
+        assert Search({"symbol": "scatter"}) != {"symbol": "scatter"}
+        assert Search({"symbol": "scatter"}).__eq__("scatter") is NotImplemented
+
+
+class TestOptionEquality:
+    """Test suite for Option.__eq__."""
+
+    def test_values_compare_by_string_form(self):
+        """Test options match when their names and values print the same."""
+        assert Option("kind", 3) == Option("kind", "3")
+        assert Option("kind", 3) != Option("kind", 4)
+
+    def test_non_option_is_not_equal(self):
+        """Test comparing against another type is always unequal."""
+        assert Option("kind", 3) != ("kind", 3)
@@ -196,6 +196,39 @@ class TestOutputFormatter:
         assert isinstance(result[0][0], dict)
         assert result[0][0]["name"] == "L5"
 
+    def test_format_board_compact_picks_up_new_data_attributes(self):
+        """Test a plain symbol gaining a data attribute is reformatted."""
+        from src.calculations.symbol import Symbol
+
+        config = Mock()
+        config.special_symbols = {"wild": ["W"]}
+        config.paytable = {(3, "H1"): 1.0, (3, "L1"): 0.5}
+        h1 = Symbol(config, "H1")
+        l1 = Symbol(config, "L1")
+        formatter = OutputFormatter(output_mode=OutputMode.COMPACT)
+        board = [[h1, l1]]
+
+        assert formatter.format_board(board, ["multiplier"]) == [["H1", "L1"]]
+        h1.assign_attribute({"multiplier": 3})
+
+        assert formatter.format_board(board, ["multiplier"]) == [
+            [{"name": "H1", "multiplier": 3}, "L1"]
+        ]
+
+    def test_format_board_compact_reflects_updated_attributes(
+        self, mock_symbol_with_multiplier
+    ):
+        """Test attribute changes between calls show up in the output."""
+        formatter = OutputFormatter(output_mode=OutputMode.COMPACT)
+        mock_symbol_with_multiplier.special = True
+        board = [[mock_symbol_with_multiplier]]
+
+        formatter.format_board(board, ["multiplier"])
+        mock_symbol_with_multiplier.multiplier = 5
+        result = formatter.format_board(board, ["multiplier"])
+
+        assert result[0][0] == {"name": "M", "multiplier": 5}
+
     def test_manual_compression_flags_ignored_in_compact_mode(self):
         """Test that manual compression flags are overridden in compact mode."""
         formatter = OutputFormatter(
@@ -0,0 +1,25 @@
+"""Unit tests for simulation criteria allocation."""
+
+import random
+
+from src.state.run_sims import assign_sim_criteria
+
+
+class TestAssignSimCriteria:
+    """Test suite for assign_sim_criteria."""
+
+    def test_allocation_indexed_by_sim(self):
+        """Test every sim gets a criteria and quotas are honoured."""
+        random.seed(0)
+        allocation = assign_sim_criteria({"basegame": 7, "freegame": 3}, 10)
+
+        assert len(allocation) == 10
+        assert allocation.count("basegame") == 7
+        assert allocation.count("freegame") == 3
+
+    def test_allocation_truncated_to_sims(self):
+        """Test surplus allocations beyond the sim count are dropped."""
+        random.seed(0)
+        allocation = assign_sim_criteria({"basegame": 8, "freegame": 4}, 10)
+
+        assert len(allocation) == 10
@@ -0,0 +1,43 @@
+"""Unit tests for WinManager."""
+
+import pytest
+
+from src.exceptions import SimulationError
+from src.wins.manager import WinManager
+
+
+class TestWinManager:
+    """Test suite for WinManager win tracking."""
+
+    def test_fused_update_matches_separate_calls(self):
+        """Test the fused update equals update_spin_win + update_game_type_wins."""
+        separate = WinManager("basegame", "freegame")
+        separate.update_spin_win(2.5)
+        separate.update_game_type_wins("freegame")
+        separate.update_spin_win(1.0)
+        separate.update_game_type_wins("basegame")
+
+        fused = WinManager("basegame", "freegame")
+        fused.update_spin_and_game_type_wins(2.5, "freegame")
+        fused.update_spin_and_game_type_wins(1.0, "basegame")
+
+        assert fused.spin_win == separate.spin_win == 3.5
+        assert fused.running_bet_win == separate.running_bet_win
+        assert fused.base_game_wins == separate.base_game_wins == 3.5
+        assert fused.free_game_wins == separate.free_game_wins == 2.5
+
+    def test_game_type_match_is_case_insensitive(self):
+        """Test game types are matched against the lower-cased mode names."""
+        manager = WinManager("BaseGame", "FreeGame")
+        manager.update_spin_and_game_type_wins(4.0, "basegame")
+
+        assert manager.base_game_wins == 4.0
+
+    def test_invalid_game_type_raises(self):
+        """Test an unknown game type raises SimulationError."""
+        manager = WinManager("basegame", "freegame")
+
+        with pytest.raises(SimulationError, match="Invalid game_type 'bonus'"):
+            manager.update_spin_and_game_type_wins(1.0, "bonus")
+        with pytest.raises(SimulationError, match="Invalid game_type 'bonus'"):
+            manager.update_game_type_wins("bonus")